@@ -0,0 +1,14 @@
+# /src/abis/aave_v3.py
+from eth_utils import keccak
+
+# Pool.getUserAccountData(address) returns six uint256 words: totalCollateralBase,
+# totalDebtBase, availableBorrowsBase, currentLiquidationThreshold, ltv, healthFactor.
+GET_USER_ACCOUNT_DATA_SELECTOR = keccak(text="getUserAccountData(address)")[:4]
+USER_ACCOUNT_DATA_SIZE = 6 * 32
+HEALTH_FACTOR_OFFSET = 5 * 32
+
+# Position events: topic1 is always the reserve, topic2 the account whose position changed.
+SUPPLY_TOPIC = keccak(text="Supply(address,address,address,uint256,uint16)")
+BORROW_TOPIC = keccak(text="Borrow(address,address,address,uint256,uint8,uint256,uint16)")
+REPAY_TOPIC = keccak(text="Repay(address,address,address,uint256,bool)")
+WITHDRAW_TOPIC = keccak(text="Withdraw(address,address,address,uint256)")
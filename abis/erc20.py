@@ -1,7 +1,13 @@
 # /src/abis/erc20.py
+from eth_utils import keccak
+
 ERC20_ABI = [
     {"constant": True, "inputs": [{"name": "_owner", "type": "address"}], "name": "balanceOf", "outputs": [{"name": "balance", "type": "uint256"}], "type": "function"},
     {"constant": True, "inputs": [], "name": "decimals", "outputs": [{"name": "", "type": "uint8"}], "type": "function"},
     {"constant": False, "inputs": [{"name": "_spender", "type": "address"}, {"name": "_value", "type": "uint256"}], "name": "approve", "outputs": [{"name": "success", "type": "bool"}], "type": "function"},
     {"constant": True, "inputs": [{"name": "_owner", "type": "address"}, {"name": "_spender", "type": "address"}], "name": "allowance", "outputs": [{"name": "remaining", "type": "uint256"}], "type": "function"}
 ]
+
+# Pre-computed selectors: one calldata layout serves every token address.
+ALLOWANCE_SELECTOR = keccak(text="allowance(address,address)")[:4]
+APPROVE_SELECTOR = keccak(text="approve(address,uint256)")[:4]
@@ -0,0 +1,11 @@
+# /src/abis/multicall3.py
+from eth_utils import keccak
+
+# Multicall3 is deployed at the same address on every EVM chain.
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+# aggregate3(Call3[] calls) with Call3 = (address target, bool allowFailure, bytes callData);
+# returns Result[] with Result = (bool success, bytes returnData).
+AGGREGATE3_SELECTOR = keccak(text="aggregate3((address,bool,bytes)[])")[:4]
+AGGREGATE3_CALLS_TYPE = "(address,bool,bytes)[]"
+AGGREGATE3_RESULTS_TYPE = "(bool,bytes)[]"
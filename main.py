@@ -3,23 +3,28 @@
 # This version correctly orchestrates multiple, isolated agents and tasks CONCURRENTLY.
 # It rejects the flawed shared-state "slow_loops" model.
 import asyncio
+import os
 from decimal import Decimal
 from aiohttp import web
+try:
+    import uvloop
+except ImportError:  # pragma: no cover – uvloop is unavailable on some platforms
+    uvloop = None
 
 # All necessary imports from our previous robust versions...
 from src.core.config import settings
 from src.core.config_validator import validate as validate_config
 from src.core.logger import configure_logging, get_logger
-from src.core.kill import is_kill_switch_active
-from src.core.drp import get_last_snapshot_timestamp
+from src.core.kill import is_kill_switch_active, run_kill_refresher, run_kill_subscriber
 from src.core.state import State
 from src.core.tx import TransactionManager
-from src.core.agent import Agent # Our intelligent, single-strategy agent
-from src.adapters.dex import DexAdapter
-from src.adapters.mempool import MempoolAdapter
-from src.adapters.ai_model import AIModelAdapter
-from src.strategies.sandwich import SandwichStrategy
-from src.strategies.rebalancer_strategy import RebalancerStrategy # Example stateful strategy
+# Strategy and adapter modules are imported inside main() only when enabled via
+# settings.ENABLED_STRATEGIES, so disabled strategies cost nothing at startup.
+
+# Bounded sandwich fan-out: a fixed worker pool drains a bounded queue so mempool
+# bursts cannot spawn unbounded tasks.
+SANDWICH_WORKERS = (os.cpu_count() or 1) * 4
+SANDWICH_QUEUE_SIZE = 1024
 
 async def healthz(request):
     """Provides a JSON health status for the service."""
@@ -36,32 +41,75 @@ async def main():
     tx_manager = TransactionManager()
     await tx_manager.initialize()
     
+    enabled = set(settings.ENABLED_STRATEGIES)
+    log.info("ENABLED_STRATEGIES", strategies=sorted(enabled))
+
     # --- Initialize Adapters ---
+    from src.adapters.ai_model import AIModelAdapter
     adapters = {
         "tx_manager": tx_manager,
-        "dex": DexAdapter(tx_manager, settings.UNISWAP_ROUTER_ADDRESS),
-        "mempool": MempoolAdapter(),
         "ai_model": AIModelAdapter(),
         # ... other async adapters ...
     }
 
     # --- TASK 1: Initialize the High-Frequency, Event-Driven Strategy ---
-    sandwich_strategy = SandwichStrategy(adapters['dex'], Decimal(settings.SANDWICH_MIN_PROFIT))
-    async def mempool_listener():
-        await adapters['mempool'].connect()
-        async for tx in adapters['mempool'].stream_transactions():
-            # Each sandwich attempt is a stateless, fire-and-forget task
-            asyncio.create_task(sandwich_strategy.process_transaction(tx, State()))
+    if "sandwich" in enabled:
+        from src.adapters.dex import DexAdapter
+        from src.adapters.mempool import MempoolAdapter
+        from src.strategies.sandwich import SandwichStrategy
+        adapters["dex"] = DexAdapter(tx_manager, settings.UNISWAP_ROUTER_ADDRESS)
+        adapters["mempool"] = MempoolAdapter()
+        sandwich_strategy = SandwichStrategy(adapters['dex'], settings.SANDWICH_MIN_PROFIT)
+
+    async def mempool_listener(tg: asyncio.TaskGroup):
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SANDWICH_QUEUE_SIZE)
+        queued_hashes: set = set()
+
+        async def sandwich_worker():
+            # Sandwich attempts are stateless, so one State per worker is safe to reuse
+            state = State()
+            while True:
+                tx = await queue.get()
+                queued_hashes.discard(tx.get("hash"))
+                try:
+                    await sandwich_strategy.process_transaction(tx, state)
+                except Exception as e:
+                    log.error("SANDWICH_WORKER_ERROR", victim_tx=tx.get("hash"), error=str(e))
+                finally:
+                    queue.task_done()
+
+        workers = [tg.create_task(sandwich_worker()) for _ in range(SANDWICH_WORKERS)]
+        async for batch in adapters['mempool'].stream_batches():
+            for tx in batch:
+                # Drop non-victims synchronously, before any queue or task work
+                if not sandwich_strategy.is_candidate(tx):
+                    continue
+                tx_hash = tx.get("hash")
+                # One attempt per victim is enough; coalesce duplicates still waiting
+                if tx_hash in queued_hashes:
+                    continue
+                try:
+                    queue.put_nowait(tx)
+                except asyncio.QueueFull:
+                    log.debug("SANDWICH_QUEUE_FULL_TX_DROPPED", victim_tx=tx_hash)
+                    continue
+                queued_hashes.add(tx_hash)
+        for worker in workers:
+            worker.cancel()
 
     # --- TASK 2: Initialize the Slow, Stateful, AI-Managed Rebalancer Agent ---
     # Each stateful strategy gets its OWN state and its OWN agent.
-    rebalancer_strategy = RebalancerStrategy()
-    rebalancer_state = State(capital_base={"USDC_ONCHAIN": Decimal("10000"), "USDT_BINANCE": Decimal("10000")})
-    rebalancer_agent = Agent(
-        strategy=rebalancer_strategy, 
-        initial_state=rebalancer_state, 
-        adapters=adapters
-    )
+    agents = []
+    if "rebalancer" in enabled:
+        from src.core.agent import Agent # Our intelligent, single-strategy agent
+        from src.strategies.rebalancer_strategy import RebalancerStrategy # Example stateful strategy
+        rebalancer_strategy = RebalancerStrategy()
+        rebalancer_state = State(capital_base={"USDC_ONCHAIN": Decimal("10000"), "USDT_BINANCE": Decimal("10000")})
+        agents.append(Agent(
+            strategy=rebalancer_strategy, 
+            initial_state=rebalancer_state, 
+            adapters=adapters
+        ))
 
     # --- TASK 3: Initialize ANOTHER Slow, Stateful Agent (e.g. for Liquidation) ---
     # liquidation_strategy = LiquidationStrategy(...)
@@ -73,23 +121,46 @@ async def main():
     app.add_routes([web.get("/healthz", healthz)])
     runner = web.AppRunner(app)
     await runner.setup()
-    site = web.TCPSite(runner, "0.0.0.0", settings.HEALTH_PORT or 8080)
+    health_port = settings.HEALTH_PORT or 8080
+    site = web.TCPSite(runner, "0.0.0.0", health_port)
     await site.start()
-    log.info(f"HEALTHCHECK_SERVER_STARTED on port {settings.HEALTH_PORT or 8080}")
+    log.info(f"HEALTHCHECK_SERVER_STARTED on port {health_port}")
+
+    await asyncio.gather(*(agent.initialize() for agent in agents))
+    head_watcher = None
+    if agents:
+        from src.core.heads import HeadWatcher
+        head_watcher = HeadWatcher()
+        adapters["heads"] = head_watcher
 
     log.info("STARTING_ALL_CONCURRENT_TASKS")
-    await asyncio.gather(
-        mempool_listener(),
-        rebalancer_agent.run_loop(),
-        # liquidation_agent.run_loop(), # Each agent runs its own independent loop
-    )
-    
-    tx_manager.close()
+    # Outside the TaskGroup: these run until every strategy task has finished
+    kill_refresher = asyncio.create_task(run_kill_refresher())
+    kill_subscriber = asyncio.create_task(run_kill_subscriber())
+    heads_task = asyncio.create_task(head_watcher.run()) if head_watcher else None
+    approvals_task = asyncio.create_task(adapters['ai_model'].watch_approvals()) if agents else None
+    async with asyncio.TaskGroup() as tg:
+        if "sandwich" in enabled:
+            tg.create_task(mempool_listener(tg))
+        for agent in agents:
+            tg.create_task(agent.run_loop()) # Each agent runs its own independent loop
+
+    kill_refresher.cancel()
+    kill_subscriber.cancel()
+    if heads_task:
+        heads_task.cancel()
+    if approvals_task:
+        approvals_task.cancel()
+    for agent in agents:
+        await agent.close()
+    await adapters['ai_model'].close()
+    await tx_manager.close()
     await runner.cleanup()
     log.warning("SYSTEM_SHUTDOWN_COMPLETE")
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop if uvloop else None) as runner:
+            runner.run(main())
     except KeyboardInterrupt:
         pass
@@ -4,36 +4,68 @@ It re-exports ABI constants from the real modules in the top-level `abis/` direc
 without duplicating data or changing project layout.
 """
 
-from importlib import import_module
-from types import ModuleType
-from typing import Dict
+import importlib.util
 import sys
-import types
-
-# Map of attribute names we want to expose -> (module_path, attr_name)
-_ABI_EXPORTS: Dict[str, tuple[str, str]] = {
-    "ERC20_ABI": ("abis.erc20", "ERC20_ABI"),
-    "UNISWAP_V2_ROUTER_ABI": ("abis.uniswap_v2", "UNISWAP_V2_ROUTER_ABI"),
-}
-
-# Ensure this package object is registered in sys.modules
-_current_module: ModuleType = sys.modules.setdefault(__name__, sys.modules.get(__name__, types.ModuleType(__name__)))
-
-for public_name, (mod_path, attr_name) in _ABI_EXPORTS.items():
-    try:
-        mod = import_module(mod_path)
-        setattr(_current_module, public_name, getattr(mod, attr_name))
-        # Also expose a proxy sub-module so 'import src.abis.<name>' works
-        proxy_name = f"{__name__}.{mod_path.split('.')[-1]}"
-        proxy_mod = types.ModuleType(proxy_name)
-        setattr(proxy_mod, attr_name, getattr(mod, attr_name))
-        sys.modules[proxy_name] = proxy_mod
-    except (ModuleNotFoundError, AttributeError):
-        # Underlying ABI module missing – expose empty placeholder to keep imports working
-        setattr(_current_module, public_name, [])
-        proxy_name = f"{__name__}.{mod_path.split('.')[-1]}"
-        proxy_mod = types.ModuleType(proxy_name)
-        setattr(proxy_mod, attr_name, [])
-        sys.modules[proxy_name] = proxy_mod
-
-__all__ = list(_ABI_EXPORTS.keys()) 
\ No newline at end of file
+from pathlib import Path
+
+# The real modules live in the top-level abis/ directory. They are loaded by file
+# path because tests put src/ first on sys.path, where a plain 'import abis'
+# resolves to this shim instead of that directory.
+_ABI_DIR = Path(__file__).resolve().parents[2] / "abis"
+
+def _load(name: str):
+    module = sys.modules.get(f"abis.{name}")
+    if module is None:
+        spec = importlib.util.spec_from_file_location(f"abis.{name}", _ABI_DIR / f"{name}.py")
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        sys.modules[f"abis.{name}"] = module
+    # Register the real modules under this package so 'import src.abis.<name>' works
+    sys.modules[f"{__name__}.{name}"] = module
+    return module
+
+_aave_v3 = _load("aave_v3")
+_erc20 = _load("erc20")
+_multicall3 = _load("multicall3")
+_uniswap_v2 = _load("uniswap_v2")
+
+GET_USER_ACCOUNT_DATA_SELECTOR = _aave_v3.GET_USER_ACCOUNT_DATA_SELECTOR
+USER_ACCOUNT_DATA_SIZE = _aave_v3.USER_ACCOUNT_DATA_SIZE
+HEALTH_FACTOR_OFFSET = _aave_v3.HEALTH_FACTOR_OFFSET
+SUPPLY_TOPIC = _aave_v3.SUPPLY_TOPIC
+BORROW_TOPIC = _aave_v3.BORROW_TOPIC
+REPAY_TOPIC = _aave_v3.REPAY_TOPIC
+WITHDRAW_TOPIC = _aave_v3.WITHDRAW_TOPIC
+
+ERC20_ABI = _erc20.ERC20_ABI
+ALLOWANCE_SELECTOR = _erc20.ALLOWANCE_SELECTOR
+APPROVE_SELECTOR = _erc20.APPROVE_SELECTOR
+
+MULTICALL3_ADDRESS = _multicall3.MULTICALL3_ADDRESS
+AGGREGATE3_SELECTOR = _multicall3.AGGREGATE3_SELECTOR
+AGGREGATE3_CALLS_TYPE = _multicall3.AGGREGATE3_CALLS_TYPE
+AGGREGATE3_RESULTS_TYPE = _multicall3.AGGREGATE3_RESULTS_TYPE
+
+UNISWAP_V2_ROUTER_ABI = _uniswap_v2.UNISWAP_V2_ROUTER_ABI
+GET_AMOUNTS_OUT_SELECTOR = _uniswap_v2.GET_AMOUNTS_OUT_SELECTOR
+SWAP_EXACT_TOKENS_FOR_TOKENS_SELECTOR = _uniswap_v2.SWAP_EXACT_TOKENS_FOR_TOKENS_SELECTOR
+
+__all__ = [
+    "ERC20_ABI",
+    "ALLOWANCE_SELECTOR",
+    "APPROVE_SELECTOR",
+    "UNISWAP_V2_ROUTER_ABI",
+    "GET_AMOUNTS_OUT_SELECTOR",
+    "SWAP_EXACT_TOKENS_FOR_TOKENS_SELECTOR",
+    "MULTICALL3_ADDRESS",
+    "AGGREGATE3_SELECTOR",
+    "AGGREGATE3_CALLS_TYPE",
+    "AGGREGATE3_RESULTS_TYPE",
+    "GET_USER_ACCOUNT_DATA_SELECTOR",
+    "USER_ACCOUNT_DATA_SIZE",
+    "HEALTH_FACTOR_OFFSET",
+    "SUPPLY_TOPIC",
+    "BORROW_TOPIC",
+    "REPAY_TOPIC",
+    "WITHDRAW_TOPIC",
+]
@@ -2,19 +2,46 @@
 # FINAL VERSION: Integrates with OpenAI for offline strategic analysis.
 # This is "The Strategist" with built-in safety via validation and manual approval.
 import os
-import json
-import aiohttp
-from pydantic import BaseModel, ValidationError
+import textwrap
+import orjson
+import httpx
+import aiofiles
+import msgspec
+try:
+    from watchfiles import awatch, Change
+except ImportError:  # pragma: no cover – approvals fall back to a direct open per tick
+    awatch = None
 
 from src.core.config import settings
+from src.core.fs import ensure_dir
 from src.core.logger import get_logger
 from src.core.kill import check, KillSwitchActiveError
 
 log = get_logger(__name__)
 # Use the session directory defined in config for durability
 APPROVAL_DIR = os.path.join(settings.SESSION_DIR, "mutation_approvals")
+APPROVED_SUFFIX = ".approved.json"
 
-class StrategyMutationRequest(BaseModel):
+# Built once at import; per call only the three fields are interpolated.
+_PROMPT_TEMPLATE = textwrap.dedent("""
+    You are a world-class quantitative analyst for a leading MEV firm.
+    Your task is to optimize the parameters for a trading strategy named '{strategy_name}'.
+
+    Current Performance Data (last cycle):
+    - Performance: {performance}
+    - Current Parameters: {current_params}
+
+    Instruction:
+    Based on this data, suggest a new set of parameters to improve profitability.
+    Your output MUST be a single, valid JSON object matching this exact schema, with no other text:
+    {{
+        "trade_amount": "<new_amount_as_string_decimal>",
+        "min_profit_usd": "<new_threshold_as_string_decimal>",
+        "rationale": "<A concise explanation for your changes. Mention why the previous values might be sub-optimal.>"
+    }}
+""")
+
+class StrategyMutationRequest(msgspec.Struct, frozen=True):
     """
     Defines the strict data schema for a parameter mutation suggestion from the LLM.
     This prevents the LLM from hallucinating invalid or dangerous parameters.
@@ -23,6 +50,15 @@ class StrategyMutationRequest(BaseModel):
     min_profit_usd: str
     rationale: str # The LLM must explain WHY it's making the suggestion.
 
+class MutationRequest(msgspec.Struct, frozen=True):
+    """The parameters an operator-approved file must carry; extra keys (e.g. rationale) are ignored."""
+    trade_amount: str
+    min_profit_usd: str
+
+# Decoders are built once; each holds the compiled schema for its Struct.
+_SUGGESTION_DECODER = msgspec.json.Decoder(StrategyMutationRequest)
+_APPROVED_DECODER = msgspec.json.Decoder(MutationRequest)
+
 class AIModelAdapter:
     """
     Interfaces with a powerful LLM to provide strategic recommendations.
@@ -31,31 +67,39 @@ class AIModelAdapter:
     def __init__(self):
         self.api_key = settings.OPENAI_API_KEY.get_secret_value() if settings.OPENAI_API_KEY else None
         self.api_url = settings.AI_MODEL_API_URL
-        os.makedirs(APPROVAL_DIR, exist_ok=True)
+        ensure_dir(APPROVAL_DIR)
+        # Strategies with an approval file on disk, maintained by watch_approvals()
+        self._approved: set[str] = set()
+        self._watching = False
+        self._client: httpx.AsyncClient | None = None
         if not self.api_key:
             log.warning("AI_MODEL_ADAPTER_NO_API_KEY", detail="Module will be inert.")
         else:
             log.info("AI_MODEL_ADAPTER_INITIALIZED_WITH_API_KEY")
 
+    def _get_client(self) -> httpx.AsyncClient:
+        """Lazily creates one HTTP/2 client; concurrent LLM calls multiplex over one connection."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=4, max_connections=8, keepalive_expiry=300),
+                timeout=httpx.Timeout(60.0),
+                headers={"Accept-Encoding": "gzip"},
+            )
+        return self._client
+
+    async def close(self):
+        """Closes the pooled HTTP client."""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+
     def _construct_prompt(self, strategy_name: str, performance_data: dict) -> str:
         """Constructs a detailed prompt for the LLM to elicit a structured JSON response."""
-        return f"""
-        You are a world-class quantitative analyst for a leading MEV firm.
-        Your task is to optimize the parameters for a trading strategy named '{strategy_name}'.
-
-        Current Performance Data (last cycle):
-        - Performance: {json.dumps(performance_data.get('performance'), indent=2)}
-        - Current Parameters: {json.dumps(performance_data.get('current_params'))}
-
-        Instruction:
-        Based on this data, suggest a new set of parameters to improve profitability.
-        Your output MUST be a single, valid JSON object matching this exact schema, with no other text:
-        {{
-            "trade_amount": "<new_amount_as_string_decimal>",
-            "min_profit_usd": "<new_threshold_as_string_decimal>",
-            "rationale": "<A concise explanation for your changes. Mention why the previous values might be sub-optimal.>"
-        }}
-        """
+        return _PROMPT_TEMPLATE.format(
+            strategy_name=strategy_name,
+            performance=orjson.dumps(performance_data.get('performance'), default=str).decode(),
+            current_params=orjson.dumps(performance_data.get('current_params'), default=str).decode(),
+        )
 
     async def fetch_and_propose_mutation(self, strategy_name: str, performance_data: dict):
         """
@@ -75,38 +119,78 @@ class AIModelAdapter:
         }
 
         try:
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=60)) as session:
-                async with session.post(self.api_url, headers=headers, json=payload) as response:
-                    response.raise_for_status()
-                    result = await response.json()
-                    llm_suggestion_str = result['choices'][0]['message']['content']
-                    
-                    # CRITICAL: Validate the JSON response against our Pydantic model
-                    validated_params = StrategyMutationRequest.model_validate_json(llm_suggestion_str)
-                    
-                    # Write the validated suggestion to a pending file
-                    filepath = os.path.join(APPROVAL_DIR, f"{strategy_name}.pending.json")
-                    with open(filepath, "w") as f: f.write(validated_params.model_dump_json(indent=2))
-                    
-                    log.warning("LLM_MUTATION_PROPOSED_AWAITING_APPROVAL", strategy=strategy_name, params=validated_params.model_dump())
-
-        except (aiohttp.ClientError, ValidationError, KeyError, json.JSONDecodeError) as e:
+            client = self._get_client()
+            response = await client.post(self.api_url, headers=headers, content=orjson.dumps(payload))
+            response.raise_for_status()
+            result = orjson.loads(response.content)
+            llm_suggestion_str = result['choices'][0]['message']['content']
+            
+            # CRITICAL: Validate the JSON response against our strict schema
+            validated_params = _SUGGESTION_DECODER.decode(llm_suggestion_str)
+            
+            # Write the validated suggestion to a pending file
+            filepath = os.path.join(APPROVAL_DIR, f"{strategy_name}.pending.json")
+            # Write-then-rename so operators never see a half-written file
+            tmp_path = filepath + ".tmp"
+            async with aiofiles.open(tmp_path, "wb") as f:
+                await f.write(msgspec.json.format(msgspec.json.encode(validated_params), indent=2))
+            os.replace(tmp_path, filepath)
+            
+            log.warning("LLM_MUTATION_PROPOSED_AWAITING_APPROVAL", strategy=strategy_name, params=msgspec.structs.asdict(validated_params))
+
+        except (httpx.HTTPError, msgspec.ValidationError, msgspec.DecodeError, KeyError, orjson.JSONDecodeError) as e:
             log.error("LLM_MUTATION_FETCH_FAILED", strategy=strategy_name, error=str(e), exc_info=True)
 
+    async def watch_approvals(self):
+        """
+        Long-running task that tracks operator approvals via filesystem
+        notifications, so get_approved_mutation() needs no stat() per tick.
+        Without watchfiles this returns immediately and each tick opens the file.
+        """
+        if awatch is None:
+            log.warning("AI_MODEL_APPROVAL_WATCHER_UNAVAILABLE", detail="watchfiles not installed")
+            return
+        with os.scandir(APPROVAL_DIR) as it:
+            self._approved.update(e.name[:-len(APPROVED_SUFFIX)] for e in it if e.name.endswith(APPROVED_SUFFIX))
+        self._watching = True
+        log.info("AI_MODEL_APPROVAL_WATCHER_STARTED", path=APPROVAL_DIR)
+        try:
+            async for changes in awatch(APPROVAL_DIR):
+                for change, path in changes:
+                    name = os.path.basename(path)
+                    if not name.endswith(APPROVED_SUFFIX):
+                        continue
+                    strategy_name = name[:-len(APPROVED_SUFFIX)]
+                    if change == Change.deleted:
+                        self._approved.discard(strategy_name)
+                    else:
+                        self._approved.add(strategy_name)
+        finally:
+            self._watching = False
+
     def get_approved_mutation(self, strategy_name: str) -> dict | None:
         """Checks for a file renamed by an operator from .pending.json to .approved.json."""
         check()
-        approved_path = os.path.join(APPROVAL_DIR, f"{strategy_name}.approved.json")
-        if os.path.exists(approved_path):
-            try:
-                with open(approved_path, "r") as f:
-                    params = json.load(f)
-                os.remove(approved_path) # Consume the approval to prevent re-application
-                log.info("APPROVED_MUTATION_FOUND_AND_CONSUMED", strategy=strategy_name, params=params)
-                return params
-            except (json.JSONDecodeError, OSError) as e:
-                log.error("FAILED_TO_CONSUME_APPROVED_MUTATION", file=approved_path, error=str(e))
-                # Move corrupted file to avoid loops
-                os.rename(approved_path, approved_path + ".corrupted")
-                return None
-        return None
+        if self._watching and strategy_name not in self._approved:
+            return None
+        self._approved.discard(strategy_name)
+        approved_path = os.path.join(APPROVAL_DIR, f"{strategy_name}{APPROVED_SUFFIX}")
+        consumed_path = approved_path + ".consumed"
+        try:
+            # Claim the approval atomically; a miss costs one rename syscall and a
+            # concurrent consumer can never apply the same file twice.
+            os.replace(approved_path, consumed_path)
+        except FileNotFoundError:
+            return None
+        try:
+            with open(consumed_path, "rb") as f:
+                # Operators may hand-edit approvals, so the file is re-validated here
+                params = msgspec.structs.asdict(_APPROVED_DECODER.decode(f.read()))
+            os.remove(consumed_path)
+            log.info("APPROVED_MUTATION_FOUND_AND_CONSUMED", strategy=strategy_name, params=params)
+            return params
+        except (msgspec.ValidationError, msgspec.DecodeError, OSError) as e:
+            log.error("FAILED_TO_CONSUME_APPROVED_MUTATION", file=approved_path, error=str(e))
+            # Move corrupted file to avoid loops
+            os.replace(consumed_path, approved_path + ".corrupted")
+            return None
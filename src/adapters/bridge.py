@@ -1,7 +1,8 @@
 # /src/adapters/bridge.py - HARDENED with explicit destination address and native gas
+from functools import lru_cache
+from eth_abi import encode as abi_encode
+from eth_utils import function_signature_to_4byte_selector, keccak
 from web3 import Web3
-from web3.contract import Contract
-from merkletools import MerkleTools
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import ec
 from cryptography.exceptions import InvalidSignature
@@ -9,17 +10,47 @@ from cryptography.exceptions import InvalidSignature
 from src.core.tx import TransactionManager, TransactionKillSwitchError
 from src.core.kill import check, KillSwitchActiveError
 from src.core.logger import get_logger
+from src.core.address import to_checksum
 
 STARGATE_ROUTER_ABI = [{"inputs":[{"internalType":"uint16","name":"_dstChainId","type":"uint16"},{"internalType":"uint256","name":"_srcPoolId","type":"uint256"},{"internalType":"uint256","name":"_dstPoolId","type":"uint256"},{"internalType":"address","name":"_refundAddress","type":"address"},{"internalType":"uint256","name":"_amountLD","type":"uint256"},{"internalType":"uint256","name":"_minAmountLD","type":"uint256"},{"components":[{"internalType":"uint256","name":"dstGasForCall","type":"uint256"},{"internalType":"uint256","name":"dstNativeAmount","type":"uint256"},{"internalType":"bytes","name":"dstNativeAddr","type":"bytes"}],"internalType":"struct IStargateRouter.lzTxObj","name":"_lzTxParams","type":"tuple"},{"internalType":"bytes","name":"_to","type":"bytes"},{"internalType":"bytes","name":"_payload","type":"bytes"}],"name":"swap","outputs":[],"stateMutability":"payable","type":"function"}]
+_STARGATE_SWAP_ABI = next(e for e in STARGATE_ROUTER_ABI if e.get("name") == "swap")
+
+def _abi_type(arg: dict) -> str:
+    if arg["type"].startswith("tuple"):
+        return "(" + ",".join(map(_abi_type, arg["components"])) + ")" + arg["type"][len("tuple"):]
+    return arg["type"]
+
+# swap() calldata is packed directly with eth_abi; the selector and type list
+# are resolved from the ABI once here instead of per call by ContractFunction.
+_STARGATE_SWAP_TYPES = tuple(map(_abi_type, _STARGATE_SWAP_ABI["inputs"]))
+STARGATE_SWAP_SELECTOR = function_signature_to_4byte_selector(f"swap({','.join(_STARGATE_SWAP_TYPES)})")
 log = get_logger(__name__)
 
+# Pure conversion; caching skips the hex parse for repeat addresses.
+@lru_cache(maxsize=4096)
+def _addr_bytes(address: str) -> bytes:
+    return Web3.to_bytes(hexstr=address)
+
+@lru_cache(maxsize=64)
+def _load_relayer_pubkey(pem: str):
+    # Relayers reuse a handful of keys; parsed key objects are immutable and safe to share.
+    return serialization.load_pem_public_key(pem.encode())
+
+def _from_hex(value: str) -> bytes:
+    return bytes.fromhex(value[2:] if value.startswith("0x") else value)
+
+def _verify_merkle_proof(proof: list[str], leaf: str, root: str) -> bool:
+    """Sorted-pair keccak256 proof check (OpenZeppelin MerkleProof convention)."""
+    node = _from_hex(leaf)
+    for sibling in map(_from_hex, proof):
+        node = keccak(node + sibling if node <= sibling else sibling + node)
+    return node == _from_hex(root)
+
 class StargateBridgeAdapter:
     def __init__(self, tx_manager: TransactionManager, router_address: str):
         self.tx_manager = tx_manager
         self.w3: Web3 = tx_manager.w3
-        self.router_address = Web3.to_checksum_address(router_address)
-        self.router_contract: Contract = self.w3.eth.contract(address=self.router_address, abi=STARGATE_ROUTER_ABI)
-        self.mt = MerkleTools(hash_type="keccak")
+        self.router_address = to_checksum(router_address)
 
     def _check_kill_switch(self):
         try:
@@ -27,7 +58,7 @@ class StargateBridgeAdapter:
         except KillSwitchActiveError:
             raise TransactionKillSwitchError("Bridge action blocked by kill switch.")
 
-    def bridge_asset(
+    async def bridge_asset(
         self,
         dest_chain_id: int,
         source_pool_id: int,
@@ -41,38 +72,36 @@ class StargateBridgeAdapter:
         self._check_kill_switch()
         log.warning("BRIDGE_TRANSFER_INITIATED", to_chain=dest_chain_id, to_address=to_address, amount=amount_ld)
 
-        lz_tx_params = {
-            "dstGasForCall": 0,
-            "dstNativeAmount": native_gas_amount,
-            "dstNativeAddr": Web3.to_bytes(hexstr=to_address)
-        }
-
-        tx_params = self.router_contract.functions.swap(
+        to_bytes = _addr_bytes(to_address)
+        lz_tx_params = (0, native_gas_amount, to_bytes)  # (dstGasForCall, dstNativeAmount, dstNativeAddr)
+        data = STARGATE_SWAP_SELECTOR + abi_encode(_STARGATE_SWAP_TYPES, (
             dest_chain_id,
             source_pool_id,
             dest_pool_id,
-            Web3.to_checksum_address(refund_address),
+            to_checksum(refund_address),
             amount_ld,
             min_amount_ld,
             lz_tx_params,
-            Web3.to_bytes(hexstr=to_address), 
+            to_bytes,
             b''
-        ).build_transaction({
-            'from': self.tx_manager.address,
-            'nonce': self.tx_manager.nonce,
+        ))
+        # Sender, nonce, chainId, gas and fees are filled in by the TransactionManager
+        tx_params = {
+            'to': self.router_address,
+            'data': data,
             'value': native_gas_amount
-        })
+        }
 
-        tx_hash = self.tx_manager.build_and_send_transaction(tx_params)
+        tx_hash = await self.tx_manager.build_and_send_transaction(tx_params)
         return tx_hash
 
     def verify_bridge_event(self, root: str, leaf: str, proof: list[str], relayer_sig: str | None = None, relayer_pubkey_pem: str | None = None) -> bool:
         self._check_kill_switch()
         if proof:
-            if not self.mt.validate_proof(proof, leaf, root):
+            if not _verify_merkle_proof(proof, leaf, root):
                 raise ValueError("Invalid Merkle proof")
         elif relayer_sig and relayer_pubkey_pem:
-            pubkey = serialization.load_pem_public_key(relayer_pubkey_pem.encode())
+            pubkey = _load_relayer_pubkey(relayer_pubkey_pem)
             try:
                 pubkey.verify(bytes.fromhex(relayer_sig), leaf.encode(), ec.ECDSA(hashes.SHA256()))
             except InvalidSignature:
@@ -1,11 +1,11 @@
 # /src/adapters/cex.py
 # HARDENED: Rewritten for asyncio using aiohttp.
 import asyncio
+import random
 import time
 import hmac
-import hashlib
-from urllib.parse import urlencode
 import aiohttp
+import orjson
 
 from src.core.config import settings
 from src.core.logger import get_logger
@@ -13,16 +13,145 @@ from src.core.kill import check, KillSwitchActiveError
 from src.core.decorators import retriable_network_call
 
 log = get_logger(__name__)
+_TIME_NS = time.time_ns
+
+# Transfer type -> (history endpoint, field holding the transfer id)
+_HISTORY_ENDPOINTS = {
+    "withdraw": ("/sapi/v1/capital/withdraw/history", "id"),
+    "deposit": ("/sapi/v1/capital/deposit/hisrec", "txId"),
+}
+_POLL_BASE_S = 1.0
+# (transfer type, Binance status code) -> terminal outcome; anything else is still pending
+_TRANSFER_STATUS = {
+    ("withdraw", 6): "SUCCESS",
+    ("deposit", 1): "SUCCESS",
+    ("withdraw", 3): "FAILED",
+    ("withdraw", 5): "FAILED",
+    ("deposit", 3): "FAILED",
+    ("deposit", 5): "FAILED",
+}
+
+class CexError(Exception):
+    """Raised for errors originating from the CEX adapter."""
+
+    pass
 
 class CexAdapter:
     """Production (async) implementation used by the live system."""
 
     BASE_URL = settings.CEX_BASE_URL
-    
+
+    def __init__(self):
+        self.api_key = settings.BINANCE_API_KEY.get_secret_value() if settings.BINANCE_API_KEY else ""
+        self.api_secret = settings.BINANCE_API_SECRET.get_secret_value() if settings.BINANCE_API_SECRET else ""
+        self._secret_bytes = self.api_secret.encode("utf-8")
+        self._session: aiohttp.ClientSession | None = None
+        # One in-flight history request per transfer type, shared by all pollers
+        self._history_inflight: dict[str, asyncio.Future] = {}
+        # type -> (fetched at, records indexed by transfer id)
+        self._history_cache: dict[str, tuple[float, dict]] = {}
+        # type -> {transfer id: earliest possible record time in ms, if known}
+        self._pending_since: dict[str, dict[str, int | None]] = {t: {} for t in _HISTORY_ENDPOINTS}
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Lazily creates one pooled session so TLS connections are reused across requests."""
+        if self._session is None or self._session.closed:
+            # No socket options needed: aiohttp sets TCP_NODELAY on every client
+            # connection it opens, and keep_warm() stops pooled sockets going idle.
+            self._session = aiohttp.ClientSession(
+                base_url=self.BASE_URL,
+                connector=aiohttp.TCPConnector(limit=64, keepalive_timeout=30, ttl_dns_cache=300),
+                timeout=aiohttp.ClientTimeout(total=10),
+                # Set once on the session rather than rebuilt per signed request
+                headers={'X-MBX-APIKEY': self.api_key},
+            )
+        return self._session
+
+    async def close(self):
+        """Closes the pooled HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    async def keep_warm(self, interval: float = 20.0):
+        """
+        Long-running task that pings the exchange so pooled TLS connections stay
+        open between bursts; the first order after idle then skips the handshake.
+        """
+        while True:
+            try:
+                await self._request("GET", "/api/v3/ping")
+            except (aiohttp.ClientError, asyncio.TimeoutError, CexError, ValueError) as e:
+                # ValueError covers orjson.JSONDecodeError from a malformed 2xx body
+                log.warning("CEX_KEEPALIVE_PING_FAILED", error=str(e))
+            await asyncio.sleep(interval)
+
+    async def _request(self, method: str, path: str) -> dict:
+        async with self._get_session().request(method, path) as response:
+            body = await response.read()
+            if response.status >= 400:
+                # Gateways answer 5xx with HTML or an empty body; never let parsing mask the status
+                try:
+                    payload = orjson.loads(body)
+                except orjson.JSONDecodeError:
+                    payload = body[:200].decode("utf-8", "replace")
+                log.error("CEX_REQUEST_FAILED", path=path.split("?", 1)[0], status=response.status, payload=payload)
+                raise CexError(f"{method} {path.split('?', 1)[0]} failed with {response.status}: {payload}")
+            return orjson.loads(body)
+
     async def _send_signed_request(self, method: str, endpoint: str, params: dict | None = None) -> dict:  # noqa: D401,E501
+        """
+        Signs and sends ``params`` as a query string. Values are joined without
+        percent-encoding, so callers must pass URL-safe (or pre-encoded) values.
+        """
+        query_string = "&".join(f"{k}={v}" for k, v in (params or {}).items())
+        return await self._send_signed_query(method, endpoint, query_string)
+
+    async def _send_signed_query(self, method: str, endpoint: str, query_string: str) -> dict:
+        check()
+        timestamp = f"timestamp={_TIME_NS() // 1_000_000}"
+        query_string = f"{query_string}&{timestamp}" if query_string else timestamp
+        # One-shot HMAC runs entirely in OpenSSL, without a Python HMAC object
+        signature = hmac.digest(self._secret_bytes, query_string.encode("utf-8"), "sha256").hex()
+        return await self._request(method, f"{endpoint}?{query_string}&signature={signature}")
+
+    @retriable_network_call
+    async def get_price(self, symbol: str) -> str:
         check()
-        # Placeholder: real implementation would use aiohttp and auth headers.
-        raise NotImplementedError("Async CexAdapter is not implemented in unit-test harness.")
+        data = await self._request("GET", f"/api/v3/ticker/price?symbol={symbol}")
+        return data['price']
+
+    async def create_order(self, symbol: str, side: str, order_type: str, quantity: float) -> dict:
+        # Fixed field order and ASCII-safe values: the query is formatted directly
+        return await self._send_signed_query(
+            "POST", "/api/v3/order", f"symbol={symbol}&side={side}&type={order_type}&quantity={quantity}"
+        )
+
+    async def _load_history(self, type: str) -> dict:
+        endpoint, id_field = _HISTORY_ENDPOINTS[type]
+        since = self._pending_since[type].values()
+        params = None
+        if since and None not in since:
+            # Only the tail covering the oldest outstanding transfer is needed
+            params = {"startTime": min(since)}
+        records = await self._send_signed_request("GET", endpoint, params)
+        index = {str(r.get(id_field)): r for r in records}
+        self._history_cache[type] = (time.monotonic(), index)
+        return index
+
+    async def _fetch_history(self, type: str, max_age: float) -> dict:
+        """
+        Returns the transfer history indexed by id, served from a cache younger
+        than ``max_age``; concurrent misses share one request.
+        """
+        cached = self._history_cache.get(type)
+        if cached is not None and time.monotonic() - cached[0] < max_age:
+            return cached[1]
+        fut = self._history_inflight.get(type)
+        if fut is None:
+            fut = asyncio.ensure_future(self._load_history(type))
+            self._history_inflight[type] = fut
+            fut.add_done_callback(lambda _: self._history_inflight.pop(type, None))
+        return await asyncio.shield(fut)
 
     @retriable_network_call
     async def get_transfer_status(
@@ -31,11 +160,37 @@ class CexAdapter:
         type: str,
         max_wait_s: int = 300,
         poll_interval: int = 15,
+        since_ms: int | None = None,
     ) -> str:  # noqa: D401,E501
+        """
+        Polls until the transfer settles, returning "SUCCESS", "FAILED", or
+        "PENDING" once ``max_wait_s`` elapses. The delay backs off from one
+        second towards ``poll_interval`` with jitter. ``since_ms`` (when the
+        transfer was submitted) lets the history query skip older records.
+        """
         check()
-        raise NotImplementedError
-    
-    # All other methods (create_order, get_price) also converted to `async def`
+        if type not in _HISTORY_ENDPOINTS:
+            raise CexError(f"Unknown transfer type: {type}")
+        deadline = time.monotonic() + max_wait_s
+        attempt = 0
+        pending = self._pending_since[type]
+        pending[transfer_id] = since_ms
+        try:
+            while True:
+                record = (await self._fetch_history(type, poll_interval / 2)).get(transfer_id)
+                if record is not None:
+                    outcome = _TRANSFER_STATUS.get((type, record.get("status")))
+                    if outcome:
+                        return outcome
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    log.warning("CEX_TRANSFER_STILL_PENDING", transfer_id=transfer_id, type=type)
+                    return "PENDING"
+                delay = min(poll_interval, _POLL_BASE_S * 1.5 ** attempt) + random.random() * 0.25
+                await asyncio.sleep(min(delay, remaining))
+                attempt += 1
+        finally:
+            pending.pop(transfer_id, None)
 
 # ------------------------------------------------------------------
 # Synchronous mock used by unit-tests
@@ -87,10 +242,3 @@ try:
 except Exception:  # pragma: no cover
     CEXAdapter = CexAdapter
 
-# Generic exception used by tests and strategies
-
-
-class CexError(Exception):
-    """Raised for errors originating from the CEX adapter."""
-
-    pass
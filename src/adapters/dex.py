@@ -1,5 +1,7 @@
 # /src/adapters/dex.py
 import time
+import asyncio
+from collections import OrderedDict
 from decimal import Decimal
 from web3 import Web3
 from web3.contract.async_contract import AsyncContract
@@ -8,29 +10,135 @@ from src.core.tx import TransactionManager, TransactionKillSwitchError
 from src.core.kill import check, KillSwitchActiveError
 from src.core.logger import get_logger
 from src.core.gas_estimator import GasEstimator # NEW: for dynamic fees
-from src.abis.erc20 import ERC20_ABI # NEW: real ABIs
-from src.abis.uniswap_v2 import UNISWAP_V2_ROUTER_ABI # NEW: real ABIs
+from src.core.address import to_checksum
+from src.abis.erc20 import ALLOWANCE_SELECTOR, APPROVE_SELECTOR # NEW: real ABIs
+from src.abis.uniswap_v2 import (  # NEW: real ABIs
+    UNISWAP_V2_ROUTER_ABI, GET_AMOUNTS_OUT_SELECTOR, SWAP_EXACT_TOKENS_FOR_TOKENS_SELECTOR,
+)
+from src.abis.multicall3 import (
+    MULTICALL3_ADDRESS, AGGREGATE3_SELECTOR, AGGREGATE3_CALLS_TYPE, AGGREGATE3_RESULTS_TYPE,
+)
+from eth_abi import encode as abi_encode, decode as abi_decode
 
 log = get_logger(__name__)
 
+# Byte offsets of the static uint256 head words in swapExactTokensForTokens calldata
+# (selector, amountIn, amountOutMin, path offset, to, deadline).
+_SWAP_AMOUNT_IN = slice(4, 36)
+_SWAP_AMOUNT_OUT_MIN = slice(36, 68)
+_SWAP_DEADLINE = slice(132, 164)
+# Paths come from victim txs, so the template cache is LRU-bounded
+SWAP_TPL_CACHE_SIZE = 1024
+
 class DexAdapter:
     def __init__(self, tx_manager: TransactionManager, router_address: str):
         self.tx_manager = tx_manager
         self.w3: Web3 = tx_manager.w3
         self.gas_estimator = GasEstimator(self.w3) # Instantiate gas estimator
-        self.router_address = Web3.to_checksum_address(router_address)
+        self.router_address = to_checksum(router_address)
         self.router: AsyncContract = self.w3.eth.contract(
             address=self.router_address, abi=UNISWAP_V2_ROUTER_ABI
         )
+        # (block number, baseFeePerGas) of the newest block seen
+        self._block_cache: tuple[int, int] | None = None
+        # (path, recipient) -> swap calldata encoded with zero amounts and deadline
+        self._swap_tpl_cache: OrderedDict[tuple, bytes] = OrderedDict()
+        # allowance(owner, router) calldata; owner and spender are fixed for the adapter's life
+        self._allowance_data: bytes | None = None
+
+    @property
+    def _allowance_calldata(self) -> bytes:
+        if self._allowance_data is None:
+            self._allowance_data = ALLOWANCE_SELECTOR + abi_encode(
+                ["address", "address"], [self.tx_manager.address, self.router_address]
+            )
+        return self._allowance_data
+
+    def update_base_fee(self, block_number: int, base_fee: int):
+        """Feeds a new head (e.g. from a newHeads subscription) into the base-fee cache."""
+        if self._block_cache is None or block_number > self._block_cache[0]:
+            self._block_cache = (block_number, base_fee)
+
+    async def _base_fee(self) -> int:
+        """Base fee of the latest block; the full block is fetched only once per block."""
+        # tx_manager.w3 is a sync Web3: each read runs in a worker thread
+        eth = self.w3.eth
+        block_number = await asyncio.to_thread(lambda: eth.block_number)
+        if self._block_cache is None or self._block_cache[0] < block_number:
+            block = await asyncio.to_thread(eth.get_block, block_number)
+            self.update_base_fee(block['number'], block['baseFeePerGas'])
+        return self._block_cache[1]
 
     async def get_quote(self, amount_in_wei: int, path: list) -> list:
         try:
             check()
-            return await self.router.functions.getAmountsOut(amount_in_wei, path).call()
+            # Hand-encoded eth_call: skips web3's per-call ABI lookup and encoder setup.
+            ret = await asyncio.to_thread(
+                self.w3.eth.call, {"to": self.router_address, "data": self._encode_quote(amount_in_wei, path)}
+            )
+            return list(abi_decode(["uint256[]"], ret)[0])
         except Exception as e:
             log.error("ASYNC_DEX_QUOTE_FAILED", path=path, error=str(e))
             raise
 
+    async def get_quotes_batch(self, requests: list[tuple[int, list]]) -> list[list | None]:
+        """
+        Quotes many (amount_in_wei, path) pairs in one eth_call through Multicall3.
+        Results keep the input order; a reverting path (e.g. no pool) yields None.
+        """
+        check()
+        calls = [(self.router_address, self._encode_quote(amount, path)) for amount, path in requests]
+        try:
+            results = await self._aggregate3(calls)
+        except Exception as e:
+            log.error("ASYNC_DEX_QUOTE_BATCH_FAILED", size=len(calls), error=str(e))
+            raise
+        # A call to an address without code "succeeds" with empty return data
+        return [list(abi_decode(["uint256[]"], out)[0]) if ok and out else None for ok, out in results]
+
+    async def allowances_batch(self, tokens: list[str]) -> dict[str, int]:
+        """
+        Reads the router's allowance for every token in one Multicall3 eth_call.
+        A token whose call reverts reports 0, so callers fall back to approving.
+        """
+        check()
+        tokens = [to_checksum(t) for t in tokens]
+        results = await self._aggregate3([(token, self._allowance_calldata) for token in tokens])
+        return {
+            token: abi_decode(["uint256"], out)[0] if ok and out else 0
+            for token, (ok, out) in zip(tokens, results)
+        }
+
+    async def _aggregate3(self, calls: list[tuple[str, bytes]]) -> list[tuple[bool, bytes]]:
+        """Sends (target, calldata) pairs as one allowFailure aggregate3 call."""
+        data = AGGREGATE3_SELECTOR + abi_encode(
+            [AGGREGATE3_CALLS_TYPE], [[(target, True, calldata) for target, calldata in calls]]
+        )
+        ret = await asyncio.to_thread(self.w3.eth.call, {"to": MULTICALL3_ADDRESS, "data": data})
+        return abi_decode([AGGREGATE3_RESULTS_TYPE], ret)[0]
+
+    def _encode_swap(self, amount_in_wei: int, min_amount_out_wei: int, path: list, to: str, deadline: int) -> bytes:
+        """Encodes the path once per (path, to), then patches the three uint256 words."""
+        key = (tuple(path), to)
+        template = self._swap_tpl_cache.get(key)
+        if template is None:
+            template = SWAP_EXACT_TOKENS_FOR_TOKENS_SELECTOR + abi_encode(
+                ["uint256", "uint256", "address[]", "address", "uint256"], [0, 0, path, to, 0]
+            )
+            self._swap_tpl_cache[key] = template
+            if len(self._swap_tpl_cache) > SWAP_TPL_CACHE_SIZE:
+                self._swap_tpl_cache.popitem(last=False)
+        else:
+            self._swap_tpl_cache.move_to_end(key)
+        data = bytearray(template)
+        data[_SWAP_AMOUNT_IN] = amount_in_wei.to_bytes(32, "big")
+        data[_SWAP_AMOUNT_OUT_MIN] = min_amount_out_wei.to_bytes(32, "big")
+        data[_SWAP_DEADLINE] = deadline.to_bytes(32, "big")
+        return bytes(data)
+
+    @staticmethod
+    def _encode_quote(amount_in_wei: int, path: list) -> bytes:
+        return GET_AMOUNTS_OUT_SELECTOR + abi_encode(["uint256", "address[]"], [amount_in_wei, path])
 
     async def approve(self, token_address: str, amount_wei: int) -> str | None:
         try:
@@ -38,18 +146,28 @@ class DexAdapter:
         except KillSwitchActiveError:
             raise TransactionKillSwitchError("DEX approval blocked by kill switch.")
 
-        token = self.w3.eth.contract(address=Web3.to_checksum_address(token_address), abi=ERC20_ABI)
-        allowance = await token.functions.allowance(self.tx_manager.address, self.router_address).call()
+        # No per-token Contract object: ERC20 calldata is the same for every token address.
+        token = to_checksum(token_address)
+        ret = await asyncio.to_thread(self.w3.eth.call, {'to': token, 'data': self._allowance_calldata})
+        allowance = abi_decode(["uint256"], ret)[0]
         if allowance >= amount_wei:
             log.info("DEX_APPROVAL_SKIPPED", token=token_address, amount=amount_wei)
             return None
 
-        tx_params = token.functions.approve(self.router_address, amount_wei).build_transaction({
-            'from': self.tx_manager.address
-        })
+        tx_params = {
+            'to': token,
+            'data': APPROVE_SELECTOR + abi_encode(["address", "uint256"], [self.router_address, amount_wei])
+        }
         return await self.tx_manager.build_and_send_transaction(tx_params)
 
-    async def swap(self, amount_in_wei: int, path: list, slippage_tolerance: Decimal = Decimal("0.005")) -> str:
+    async def swap(
+        self,
+        amount_in_wei: int,
+        path: list,
+        slippage_bps: int = 50,
+        slippage_tolerance: Decimal | None = None,
+    ) -> str:
+        """Swaps along ``path``; slippage is in basis points (``slippage_tolerance`` is the legacy fraction form)."""
         try:
             check()
         except KillSwitchActiveError:
@@ -57,25 +175,25 @@ class DexAdapter:
         
         deadline = int(time.time()) + 120
         
-        # Calculate min_amount_out with slippage tolerance
-        quote = await self.get_quote(amount_in_wei, path)
-        min_amount_out_wei = int(Decimal(quote[-1]) * (Decimal(1) - slippage_tolerance))
-
-        # Get dynamic gas fee
-        priority_fee = await self.gas_estimator.get_priority_fee()
-
-        tx_params = self.router.functions.swapExactTokensForTokens(
-            amount_in_wei,
-            min_amount_out_wei,
-            path,
-            self.tx_manager.address,
-            deadline
-        ).build_transaction({
-            'from': self.tx_manager.address,
+        if slippage_tolerance is not None:
+            slippage_bps = int(slippage_tolerance * 10_000)
+
+        # Quote and fee inputs are independent reads: one round trip instead of three
+        quote, priority_fee, base_fee = await asyncio.gather(
+            self.get_quote(amount_in_wei, path),
+            self.gas_estimator.get_priority_fee(),
+            self._base_fee(),
+        )
+        # Calculate min_amount_out with slippage tolerance (integer fixed-point)
+        min_amount_out_wei = quote[-1] * (10_000 - slippage_bps) // 10_000
+
+        tx_params = {
+            'to': self.router_address,
+            'data': self._encode_swap(amount_in_wei, min_amount_out_wei, path, self.tx_manager.address, deadline),
             'value': 0,
             'maxPriorityFeePerGas': priority_fee,
-            'maxFeePerGas': (await self.w3.eth.get_block('latest'))['baseFeePerGas'] + priority_fee
-        })
+            'maxFeePerGas': base_fee + priority_fee
+        }
         return await self.tx_manager.build_and_send_transaction(tx_params)
 
 # -------------------------------------------------------------
@@ -87,19 +205,27 @@ class DexAdapter:
 # touching all test callers we expose the *mock* implementation when the
 # adapter is requested via the legacy name.
 
-try:
-    from src.adapters.mock import MockDexAdapter, MockTransactionManager  # Local import
-
-    class _ZeroArgDexAdapter(MockDexAdapter):  # type: ignore
-        """A thin wrapper that injects a default MockTransactionManager when
-        instantiated without parameters (unit-test convenience)."""
-
-        def __init__(self, *args, **kwargs):  # noqa: D401
-            if not args and not kwargs:
-                super().__init__(MockTransactionManager())
-            else:
-                super().__init__(*args, **kwargs)  # type: ignore[arg-type]
-
-    DEXAdapter = _ZeroArgDexAdapter  # type: ignore
-except Exception:  # pragma: no cover – fallback for production builds where mocks are trimmed
-    DEXAdapter = DexAdapter  # Fallback to real implementation if mock is unavailable
+# The mock is imported only when ``DEXAdapter`` is first accessed (PEP 562), so
+# production processes importing ``DexAdapter`` never load the mock machinery.
+
+def __getattr__(name: str):
+    if name != "DEXAdapter":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        from src.adapters.mock import MockDexAdapter, MockTransactionManager  # Local import
+
+        class _ZeroArgDexAdapter(MockDexAdapter):  # type: ignore
+            """A thin wrapper that injects a default MockTransactionManager when
+            instantiated without parameters (unit-test convenience)."""
+
+            def __init__(self, *args, **kwargs):  # noqa: D401
+                if not args and not kwargs:
+                    super().__init__(MockTransactionManager())
+                else:
+                    super().__init__(*args, **kwargs)  # type: ignore[arg-type]
+
+        adapter_cls = _ZeroArgDexAdapter
+    except Exception:  # pragma: no cover – fallback for production builds where mocks are trimmed
+        adapter_cls = DexAdapter  # Fallback to real implementation if mock is unavailable
+    globals()["DEXAdapter"] = adapter_cls  # cache: later lookups skip this hook
+    return adapter_cls
@@ -5,12 +5,15 @@
 
 from typing import List, Dict
 
+from eth_abi import encode as abi_encode
+from eth_utils import keccak
 from web3 import Web3
 from web3.contract import Contract
 
 from src.core.tx import TransactionManager, TransactionKillSwitchError
 from src.core.kill import check, KillSwitchActiveError
 from src.core.logger import get_logger
+from src.core.address import to_checksum
 
 log = get_logger(__name__)
 
@@ -19,6 +22,8 @@ RECEIVER_ABI = [
     {"inputs": [{"internalType": "address[]", "name": "assets", "type": "address[]"}, {"internalType": "uint256[]", "name": "amounts", "type": "uint256[]"}, {"internalType": "bytes", "name": "params", "type": "bytes"}], "name": "initiateFlashloan", "outputs": [], "stateMutability": "nonpayable", "type": "function"},
     {"inputs": [{"internalType": "address", "name": "target", "type": "address"}, {"internalType": "bytes", "name": "data", "type": "bytes"}], "name": "executeCall", "outputs": [], "stateMutability": "nonpayable", "type": "function"}
 ]
+INITIATE_FLASHLOAN_SELECTOR = keccak(text="initiateFlashloan(address[],uint256[],bytes)")[:4]
+EXECUTE_CALL_SELECTOR = keccak(text="executeCall(address,bytes)")[:4]
 
 class FlashloanAdapter:
     """
@@ -28,7 +33,7 @@ class FlashloanAdapter:
     def __init__(self, tx_manager: TransactionManager, receiver_address: str):
         self.tx_manager = tx_manager
         self.w3: Web3 = tx_manager.w3
-        self.receiver_address = Web3.to_checksum_address(receiver_address)
+        self.receiver_address = to_checksum(receiver_address)
         self.receiver_contract: Contract = self.w3.eth.contract(
             address=self.receiver_address, abi=RECEIVER_ABI
         )
@@ -44,7 +49,7 @@ class FlashloanAdapter:
         except KillSwitchActiveError:
             raise TransactionKillSwitchError("Flash loan blocked by system kill switch.")
 
-    def initiate_flashloan(
+    async def initiate_flashloan(
         self,
         loan_assets: List[str],
         loan_amounts: List[int],
@@ -71,17 +76,16 @@ class FlashloanAdapter:
             receiver=self.receiver_address,
         )
 
-        # Build the transaction to call `initiateFlashloan` on our receiver contract.
-        tx_params = self.receiver_contract.functions.initiateFlashloan(
-            loan_assets,
-            loan_amounts,
-            encoded_action_calldata
-        ).build_transaction({
-            'from': self.tx_manager.address,
-            'nonce': self.tx_manager.nonce,
-        })
+        # Build the `initiateFlashloan` call directly; the TransactionManager fills in
+        # sender, nonce, chainId, gas and fees (its preflight reads run concurrently).
+        tx_params = {
+            'to': self.receiver_address,
+            'data': INITIATE_FLASHLOAN_SELECTOR + abi_encode(
+                ["address[]", "uint256[]", "bytes"], [loan_assets, loan_amounts, encoded_action_calldata]
+            ),
+        }
 
-        return self.tx_manager.build_and_send_transaction(tx_params)
+        return await self.tx_manager.build_and_send_transaction(tx_params)
 
     def encode_action_chain(self, targets: List[str], calldatas: List[bytes]) -> bytes:
         """
@@ -107,4 +111,4 @@ class FlashloanAdapter:
             raise NotImplementedError("This helper currently supports only a single action.")
 
         # This encodes the call to `FlashloanReceiver.executeCall(target, data)`
-        return self.receiver_contract.functions.executeCall(targets[0], calldatas[0])._encode_transaction_data()
+        return EXECUTE_CALL_SELECTOR + abi_encode(["address", "bytes"], [targets[0], calldatas[0]])
@@ -1,8 +1,13 @@
 # /src/adapters/mempool.py
 import asyncio
-import json
-import websockets
+from collections import OrderedDict
+import orjson
 from websockets.exceptions import ConnectionClosed
+try:
+    # websockets >= 13: the asyncio client with the C-accelerated frame parser
+    from websockets.asyncio.client import connect as ws_connect
+except ImportError:  # pragma: no cover – older websockets only ships the legacy client
+    from websockets import connect as ws_connect
 
 from src.core.config import settings
 from src.core.kill import check, KillSwitchActiveError
@@ -11,60 +16,208 @@ from src.core.logger import get_logger
 log = get_logger(__name__)
 
 MEMPOOL_WSS_URLS = [u.strip() for u in settings.MEMPOOL_WSS_URL.get_secret_value().split(',')]
+# Sent as a text frame; the payload never changes, so it is serialized once.
+_SUBSCRIBE_MSG = orjson.dumps({
+    "id": 1, "method": "eth_subscribe", "params": ["newPendingTransactions"]
+}).decode()
+
+def _is_tx_frame(message) -> bool:
+    """
+    Substring pre-check run before parsing: acks and heartbeats carry no
+    "result", and hash-only feeds carry a string result we cannot use.
+    """
+    if isinstance(message, str):
+        return '"result"' in message and '"result":"' not in message
+    return b'"result"' in message and b'"result":"' not in message
+
+_HASH_RESULT = {str: ('"result":"', '"params"', '"'), bytes: (b'"result":"', b'"params"', b'"')}
+
+def _hash_only_result(message) -> str | None:
+    """
+    The tx hash of a hash-only notification, sliced straight out of the frame
+    without parsing it; None for any other frame.
+    """
+    needle, params, quote = _HASH_RESULT[str if isinstance(message, str) else bytes]
+    start = message.find(needle)
+    if start < 0 or params not in message:
+        return None
+    start += len(needle)
+    end = start + 66  # "0x" + 32 bytes of hex
+    if message[end:end + 1] != quote:
+        return None
+    tx_hash = message[start:end]
+    return tx_hash if isinstance(tx_hash, str) else tx_hash.decode()
 
 class MempoolAdapter:
-    def __init__(self, wss_urls: list[str] = MEMPOOL_WSS_URLS):
+    """
+    Subscribes to every configured feed at once and merges them: each tx is
+    yielded from whichever feed saw it first, duplicates from slower feeds
+    are dropped by hash.
+    """
+    def __init__(
+        self,
+        wss_urls: list[str] = MEMPOOL_WSS_URLS,
+        queue_size: int = 4096,
+        seen_size: int = 16384,
+        yield_hashes: bool = False,
+    ):
         self.wss_urls = wss_urls
-        self.idx = 0
-        self.connection = None
-        self.stall_timeout = 0.5  # 500ms stall detection
+        # Hash-only feeds yield {"hash": ...} when enabled. Off by default: those
+        # consumers need the full tx, and a hash sighting would dedupe it away.
+        self.yield_hashes = yield_hashes
+        self.connections: dict = {}
+        # Per-feed liveness: the websocket library pings every second and closes
+        # the connection if a pong takes longer than stall_timeout.
+        self.ping_interval = 1.0
+        self.stall_timeout = 0.5
+        # Raw frames handed from the socket readers to the parsing consumer;
+        # None marks the end of the stream.
+        self._q: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self._seen: OrderedDict = OrderedDict()
+        self._seen_size = seen_size
+        # Readers still running; the last one to stop queues the end-of-stream None
+        self._live_readers = 0
 
-    async def connect(self):
+    async def connect(self, url: str):
         check()
-        url = self.wss_urls[self.idx]
         log.info("MEMPOOL_ADAPTER_CONNECTING", url=url)
         try:
-            self.connection = await websockets.connect(url)
-            await self.connection.send(json.dumps({
-                "id": 1, "method": "eth_subscribe", "params": ["newPendingTransactions"]
-            }))
-            await self.connection.recv()
-            log.info("MEMPOOL_ADAPTER_CONNECTED_AND_SUBSCRIBED")
+            # Pending-tx frames are small JSON: deflate only costs CPU per frame
+            connection = await ws_connect(
+                url,
+                compression=None,
+                max_size=1 << 20,
+                max_queue=4096,
+                ping_interval=self.ping_interval,
+                ping_timeout=self.stall_timeout,
+            )
+            await connection.send(_SUBSCRIBE_MSG)
+            await connection.recv()
+            log.info("MEMPOOL_ADAPTER_CONNECTED_AND_SUBSCRIBED", url=url)
         except (ConnectionClosed, OSError) as e:
-            log.error("MEMPOOL_CONNECTION_FAILED", error=str(e), exc_info=True)
-            self.connection = None
+            log.error("MEMPOOL_CONNECTION_FAILED", url=url, error=str(e), exc_info=True)
+            self.connections.pop(url, None)
             raise
+        self.connections[url] = connection
+        return connection
 
-    async def stream_transactions(self):
+    def _enqueue(self, message):
+        if self._q.full():
+            # Stale pending txs are worthless; keep the newest.
+            self._q.get_nowait()
+            log.warning("MEMPOOL_DROPPED", queue_size=self._q.maxsize)
+        self._q.put_nowait(message)
+
+    def _first_sighting(self, tx_hash) -> bool:
+        if tx_hash in self._seen:
+            return False
+        self._seen[tx_hash] = None
+        if len(self._seen) > self._seen_size:
+            self._seen.popitem(last=False)
+        return True
+
+    async def _reader(self, url: str):
+        """
+        Owns one feed's socket: receives frames as fast as they arrive and
+        queues them, so a slow consumer never stalls recv() into a false
+        reconnect. A stall or disconnect only reconnects this feed.
+        """
         while True:
             try:
                 check()
             except KillSwitchActiveError:
-                log.critical("MEMPOOL_ABORTED_BY_KILL_SWITCH")
+                log.critical("MEMPOOL_ABORTED_BY_KILL_SWITCH", url=url)
                 break
-            if not self.connection or self.connection.closed:
+            # Dropped connections are removed from the map, so presence means live
+            connection = self.connections.get(url)
+            if connection is None:
                 try:
-                    await self.connect()
+                    connection = await self.connect(url)
                 except Exception:
                     await asyncio.sleep(5)
-                    self.idx = (self.idx + 1) % len(self.wss_urls)
                     continue
 
             try:
-                message = await asyncio.wait_for(self.connection.recv(), timeout=self.stall_timeout)
-                data = json.loads(message)
-                tx = data.get("params", {}).get("result", {})
-                if tx and isinstance(tx, dict):
-                    yield tx
-            except asyncio.TimeoutError:
-                log.warning("MEMPOOL_FEED_STALLED", url=self.wss_urls[self.idx])
-                self.idx = (self.idx + 1) % len(self.wss_urls)
-                self.connection = None
+                # recv() returns as soon as a frame lands; a dead peer surfaces as
+                # ConnectionClosed once a keepalive ping goes unanswered.
+                message = await connection.recv()
             except ConnectionClosed:
-                log.warning("MEMPOOL_CONNECTION_CLOSED_RECONNECTING")
-                self.connection = None
+                log.warning("MEMPOOL_CONNECTION_CLOSED_RECONNECTING", url=url)
+                self.connections.pop(url, None)
+                continue
             except Exception as e:
-                log.error("MEMPOOL_STREAM_ERROR", error=str(e))
+                log.error("MEMPOOL_STREAM_ERROR", url=url, error=str(e))
                 await asyncio.sleep(1)
+                continue
+            self._enqueue(message)
+
+    async def _run_reader(self, url: str):
+        try:
+            await self._reader(url)
+        finally:
+            # The last reader to stop ends the stream. The sentinel is queued in the
+            # same step as that reader's final frame, so it goes through the same
+            # drop-oldest path as any other frame.
+            self._live_readers -= 1
+            if self._live_readers == 0:
+                self._enqueue(None)
 
-        return
+    async def _run_readers(self):
+        self._live_readers = len(self.wss_urls)
+        if not self.wss_urls:
+            self._enqueue(None)
+        await asyncio.gather(*(self._run_reader(url) for url in self.wss_urls))
+
+    async def stream_transactions(self):
+        readers = asyncio.create_task(self._run_readers())
+        try:
+            while True:
+                message = await self._q.get()
+                if message is None:
+                    break
+                if not _is_tx_frame(message):
+                    if self.yield_hashes:
+                        tx_hash = _hash_only_result(message)
+                        if tx_hash is not None and self._first_sighting(tx_hash):
+                            yield {"hash": tx_hash}
+                    continue
+                try:
+                    data = orjson.loads(message)
+                except orjson.JSONDecodeError as e:
+                    log.error("MEMPOOL_STREAM_ERROR", error=str(e))
+                    continue
+                tx = data.get("params", {}).get("result", {})
+                if tx and isinstance(tx, dict) and self._first_sighting(tx.get("hash")):
+                    yield tx
+        finally:
+            readers.cancel()
+
+    async def stream_batches(self, max_batch: int = 32, linger: float = 0.002):
+        """
+        Groups the tx stream into lists of up to ``max_batch`` so consumers pay
+        scheduling cost per batch, not per tx. A partial batch is flushed once
+        no new tx has arrived for ``linger`` seconds.
+        """
+        stream = self.stream_transactions()
+        pending = None
+        batch = []
+        try:
+            while True:
+                if pending is None:
+                    pending = asyncio.ensure_future(anext(stream))
+                done, _ = await asyncio.wait({pending}, timeout=linger if batch else None)
+                if done:
+                    fut, pending = pending, None
+                    try:
+                        batch.append(fut.result())
+                    except StopAsyncIteration:
+                        break
+                    if len(batch) < max_batch:
+                        continue
+                yield batch
+                batch = []
+            if batch:
+                yield batch
+        finally:
+            if pending is not None:
+                pending.cancel()
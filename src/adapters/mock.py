@@ -4,7 +4,8 @@
 # - Enables "Simulation-first" development and robust unit/integration testing.
 # - Fulfills the requirement for testing before mainnet runs.
 
-from typing import List, Dict
+from collections import defaultdict, deque
+from typing import List, Dict, Deque, Tuple
 from decimal import Decimal
 
 from src.core.tx import TransactionManager, TransactionKillSwitchError
@@ -18,10 +19,13 @@ class MockTransactionManager(TransactionManager):
     A mock implementation of TransactionManager for testing purposes.
     It does not send real transactions but simulates the process.
     """
-    def __init__(self, from_address: str = "0xMockExecutor"):
+    SENT_HISTORY_SIZE = 8192
+
+    def __init__(self, from_address: str = "0xMockExecutor", unbounded: bool = False):
         self.address = from_address
         self.nonce = 0
-        self.sent_transactions = []
+        # Long backtests keep only the most recent sends unless full history is requested
+        self.sent_transactions: Deque[dict] = deque(maxlen=None if unbounded else self.SENT_HISTORY_SIZE)
         self._must_fail = False
         log.info("MOCK_TRANSACTION_MANAGER_INITIALIZED", address=self.address)
 
@@ -66,8 +70,8 @@ class MockDexAdapter:
         if not isinstance(tx_manager, MockTransactionManager):
             raise TypeError("MockDexAdapter must be initialized with a MockTransactionManager.")
         self.tx_manager = tx_manager
-        # Quotes are defined as a dict: "TOKEN_IN_ADDR-TOKEN_OUT_ADDR" -> output_amount
-        self.quotes: Dict[str, int] = {}
+        # Quotes are defined as a dict: (TOKEN_IN_ADDR, ..., TOKEN_OUT_ADDR) -> output_amount
+        self.quotes: Dict[Tuple[str, ...], int] = {}
         # Allowances: owner -> spender -> amount
         self.allowances: Dict[str, Dict[str, int]] = {}
         self.router_address = "0xMockRouter"
@@ -83,16 +87,15 @@ class MockDexAdapter:
         # Allow setting quotes even when the kill switch is active to enable
         # unit-tests that prepare market conditions during a simulated halt.
         """Set a predictable output amount for a given trade path."""
-        key = "-".join(path)
-        self.quotes[key] = amount_out
+        self.quotes[tuple(path)] = amount_out
         log.info("MOCK_DEX_QUOTE_SET", path=path, amount_out=amount_out)
 
     def get_quote(self, amount_in_wei: int, path: List[str]) -> List[int]:
         self._check_kill_switch()
         """Returns a pre-configured quote for a swap path."""
-        key = "-".join(path)
-        if key in self.quotes:
-            return [amount_in_wei, self.quotes[key]]
+        amount_out = self.quotes.get(tuple(path))
+        if amount_out is not None:
+            return [amount_in_wei, amount_out]
         raise ValueError(f"No mock quote set for path {path}")
 
     def approve(self, token_address: str, amount_wei: int) -> str | None:
@@ -119,8 +122,8 @@ class MockDexAdapter:
         """Simulates a swap, returning a fake transaction hash."""
         self._check_kill_switch()
         
-        quote_key = "-".join(path)
-        if quote_key not in self.quotes or self.quotes[quote_key] < min_amount_out_wei:
+        amount_out = self.quotes.get(tuple(path))
+        if amount_out is None or amount_out < min_amount_out_wei:
             log.error("MOCK_SWAP_WOULD_FAIL_SLIPPAGE", path=path, min_out=min_amount_out_wei)
             raise ValueError("Mock Slippage error")
 
@@ -129,3 +132,30 @@ class MockDexAdapter:
             "data": f"swap(in={amount_in_wei}, path={path})"
         }
         return self.tx_manager.build_and_send_transaction(tx_params)
+
+
+class MockAIModelAdapter:
+    """
+    A mock implementation of AIModelAdapter for testing strategy mutation.
+    Suggestions are queued per strategy and handed out in FIFO order.
+    """
+    def __init__(self):
+        self.suggestion_queue: Dict[str, Deque[dict]] = defaultdict(deque)
+        log.info("MOCK_AI_MODEL_ADAPTER_INITIALIZED")
+
+    def queue_suggestion(self, strategy_name: str, new_params: dict):
+        """Queue a parameter suggestion to be returned for a strategy."""
+        self.suggestion_queue[strategy_name].append(new_params)
+        log.info("MOCK_AI_SUGGESTION_QUEUED", strategy=strategy_name, params=new_params)
+
+    def get_parameter_suggestion(self, strategy_name: str) -> dict | None:
+        """Pops the oldest queued suggestion for the strategy, if any."""
+        q = self.suggestion_queue.get(strategy_name)
+        return q.popleft() if q else None
+
+    async def fetch_and_propose_mutation(self, strategy_name: str, performance_data: dict):
+        log.info("MOCK_AI_MUTATION_REQUESTED", strategy=strategy_name)
+
+    def get_approved_mutation(self, strategy_name: str) -> dict | None:
+        check()
+        return self.get_parameter_suggestion(strategy_name)
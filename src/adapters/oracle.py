@@ -1,20 +1,66 @@
 # /src/adapters/oracle.py
 from decimal import Decimal
 import asyncio
-import aiohttp
+import time
+import httpx
 from web3 import Web3
+from eth_abi import encode as abi_encode, decode as abi_decode
+from eth_utils import function_signature_to_4byte_selector
 
 from src.core.resilient_rpc import ResilientWeb3Provider # Use async provider
 from src.core.logger import get_logger
+from src.core.constants import TEN_8, TEN_18, MAX_ORACLE_DEVIATION, MAINNET
 from src.core.kill import check, KillSwitchActiveError
+from src.core.heads import HeadWatcher
+from src.abis.aave_v3 import GET_USER_ACCOUNT_DATA_SELECTOR, HEALTH_FACTOR_OFFSET
+from src.abis.multicall3 import (
+    MULTICALL3_ADDRESS, AGGREGATE3_SELECTOR, AGGREGATE3_CALLS_TYPE, AGGREGATE3_RESULTS_TYPE,
+)
 
 log = get_logger(__name__)
 
+# Users per aggregate3 call; keeps return data well under node response caps.
+HEALTH_FACTOR_BATCH_SIZE = 500
+_HEALTH_FACTOR_WORD = slice(HEALTH_FACTOR_OFFSET, HEALTH_FACTOR_OFFSET + 32)
+# Validated medians are reused for this long; well inside the Chainlink heartbeat.
+PRICE_CACHE_TTL_S = 5.0
+# Per-source latency budgets (seconds): a leg that misses its budget is dropped
+# rather than holding up every price consumer.
+PRICE_SOURCE_TIMEOUTS_S = {"coingecko": 0.8, "chainlink": 0.3, "twap": 0.5}
+# Chainlink ETH/USD heartbeat; a round older than this is treated as a dead feed.
+CHAINLINK_HEARTBEAT_S = 3600
+# Placeholder feed and TWAP oracle addresses until per-pair deployments are wired in
+CHAINLINK_FEED_ADDRESS = "0x0000000000000000000000000000000000000000"
+TWAP_ORACLE_ADDRESS = "0x0000000000000000000000000000000000000000"
+_LATEST_ROUND_DATA_SELECTOR = function_signature_to_4byte_selector("latestRoundData()")
+_CONSULT_SELECTOR = function_signature_to_4byte_selector("consult(address,uint256)")
+_ROUND_DATA_TYPES = ["uint80", "int256", "uint256", "uint256", "uint80"]
+
+def _account_data_calldata(user: str) -> bytes:
+    """getUserAccountData(user) calldata: the selector plus the address left-padded to one word."""
+    return GET_USER_ACCOUNT_DATA_SELECTOR + bytes.fromhex(user[2:]).rjust(32, b"\0")
+
 class OracleAdapter:
-    def __init__(self):
+    def __init__(
+        self,
+        price_ttl: float = PRICE_CACHE_TTL_S,
+        heartbeat: int = CHAINLINK_HEARTBEAT_S,
+        heads: HeadWatcher | None = None,
+    ):
         self.provider = ResilientWeb3Provider() # It's now async
         self.w3 = self.provider.get_primary_provider()
-        self.http = aiohttp.ClientSession()
+        self._http: httpx.AsyncClient | None = None
+        self.pool_address = MAINNET.AAVE_V3_POOL
+        self.price_ttl = price_ttl
+        self.heartbeat = heartbeat
+        # Source of the current block timestamp for staleness checks, if running
+        self.heads = heads
+        # pair -> (median price, monotonic time it was fetched)
+        self._price_cache: dict[str, tuple[Decimal, float]] = {}
+        # One in-flight fan-out per pair, shared by concurrent callers
+        self._price_inflight: dict[str, asyncio.Future] = {}
+        # One in-flight Chainlink + TWAP batch per pair, shared by both on-chain legs
+        self._onchain_inflight: dict[str, asyncio.Future] = {}
 
     async def initialize(self):
         try:
@@ -24,34 +70,177 @@ class OracleAdapter:
         await self.provider.initialize()
         log.info("ASYNC_ORACLE_ADAPTER_INITIALIZED")
 
+    @property
+    def http(self) -> httpx.AsyncClient:
+        """One pooled HTTP/2 client, so parallel price fetches multiplex over one TLS connection."""
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_connections=50, max_keepalive_connections=20, keepalive_expiry=60),
+                timeout=httpx.Timeout(5.0, connect=1.0),
+            )
+        return self._http
+
+    async def close(self):
+        """Closes the pooled HTTP client."""
+        if self._http is not None and not self._http.is_closed:
+            await self._http.aclose()
+
+    async def __aenter__(self):
+        await self.initialize()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
     async def _coingecko_price(self, symbol: str) -> Decimal:
         check()
         url = f"https://api.coingecko.com/api/v3/simple/price?ids={symbol}&vs_currencies=usd"
-        async with self.http.get(url) as resp:
-            data = await resp.json()
-            return Decimal(str(data[symbol]["usd"]))
+        resp = await self.http.get(url)
+        return Decimal(str(resp.json()[symbol]["usd"]))
+
+    def _onchain_reads(self, pair: str) -> asyncio.Future:
+        """
+        latestRoundData and the TWAP consult for ``pair`` as one JSON-RPC batch
+        per node: whichever leg asks first sends it, the other joins.
+        """
+        fut = self._onchain_inflight.get(pair)
+        if fut is None:
+            # TWAP price of one whole base token (placeholder token, like the addresses)
+            consult = _CONSULT_SELECTOR + abi_encode(["address", "uint256"], [TWAP_ORACLE_ADDRESS, 10**18])
+            fut = asyncio.ensure_future(self.provider.batch_call_consensus(self.http, [
+                (CHAINLINK_FEED_ADDRESS, _LATEST_ROUND_DATA_SELECTOR),
+                (TWAP_ORACLE_ADDRESS, consult),
+            ]))
+            self._onchain_inflight[pair] = fut
+
+            def done(f: asyncio.Future):
+                self._onchain_inflight.pop(pair, None)
+                # Both legs may have given up already; retrieve a failure so it is not reported as lost
+                if not f.cancelled():
+                    f.exception()
+            fut.add_done_callback(done)
+        return fut
 
     async def _chainlink_price(self, pair: str) -> Decimal:
         check()
-        # Placeholder for on-chain Chainlink call
-        price_wei = await self.provider.call_consensus("0x0000000000000000000000000000000000000000", [], "latestRoundData")
-        return Decimal(price_wei) / Decimal(1e8)
+        # Shielded: one leg timing out must not cancel the batch the other awaits
+        ret = (await asyncio.shield(self._onchain_reads(pair)))[0]
+        round_id, answer, _, updated_at, answered_in_round = abi_decode(_ROUND_DATA_TYPES, ret)
+        if answer <= 0 or answered_in_round < round_id or self._block_timestamp() - updated_at > self.heartbeat:
+            raise ValueError(f"Stale Chainlink round {round_id} for {pair} (updatedAt={updated_at})")
+        return Decimal(answer) / TEN_8
+
+    def _block_timestamp(self) -> int:
+        """Latest head's timestamp from the newHeads feed; wall clock when no feed is running."""
+        if self.heads is not None and self.heads.latest is not None:
+            return int(self.heads.latest["timestamp"], 16)
+        return int(time.time())
 
     async def _uniswap_twap(self, pair: str) -> Decimal:
         check()
-        # Placeholder for on-chain TWAP
-        price_wei = await self.provider.call_consensus("0x0000000000000000000000000000000000000000", [], "consult", pair)
-        return Decimal(price_wei) / Decimal(1e18)
+        ret = (await asyncio.shield(self._onchain_reads(pair)))[1]
+        return Decimal(abi_decode(["uint256"], ret)[0]) / TEN_18
 
     async def get_price(self, pair: str) -> Decimal:
+        """
+        Median of CoinGecko, Chainlink and the TWAP, cached per pair for
+        ``price_ttl`` seconds; concurrent misses share one fan-out.
+        """
         check()
-        coingecko, chainlink, twap = await asyncio.gather(
-            self._coingecko_price(pair),
-            self._chainlink_price(pair),
-            self._uniswap_twap(pair)
-        )
-        prices = sorted([coingecko, chainlink, twap])
-        median_price = prices[1]
-        if abs(median_price - twap) / twap > Decimal("0.01"):
-            raise ValueError("Median price deviates >1% from on-chain TWAP")
+        cached = self._price_cache.get(pair)
+        if cached is not None and time.monotonic() - cached[1] < self.price_ttl:
+            return cached[0]
+        fut = self._price_inflight.get(pair)
+        if fut is None:
+            fut = asyncio.ensure_future(self._load_price(pair))
+            self._price_inflight[pair] = fut
+            fut.add_done_callback(lambda _: self._price_inflight.pop(pair, None))
+        return await asyncio.shield(fut)
+
+    async def _load_price(self, pair: str) -> Decimal:
+        """
+        The on-chain legs decide: when Chainlink and the TWAP both answer in
+        budget, CoinGecko only joins the median if it is already in.
+        CoinGecko is awaited only to stand in for a failed on-chain leg.
+        """
+        coingecko_task = asyncio.ensure_future(self._timed("coingecko", self._coingecko_price(pair)))
+        try:
+            chainlink, twap = await asyncio.gather(
+                self._timed("chainlink", self._chainlink_price(pair)),
+                self._timed("twap", self._uniswap_twap(pair)),
+            )
+            if chainlink is not None and twap is not None:
+                coingecko = coingecko_task.result() if coingecko_task.done() else None
+                if coingecko is None:
+                    median_price = chainlink
+                else:
+                    # Median of three by comparisons: no list to allocate and sort
+                    median_price = max(min(coingecko, chainlink), min(max(coingecko, chainlink), twap))
+                reference = twap
+            else:
+                coingecko = await coingecko_task
+                median_price = chainlink if chainlink is not None else twap
+                reference = coingecko
+                if median_price is None or reference is None:
+                    raise ValueError(f"Fewer than two price sources answered for {pair}")
+        finally:
+            coingecko_task.cancel()
+        if abs(median_price - reference) / reference > MAX_ORACLE_DEVIATION:
+            raise ValueError("Median price deviates >1% from reference source")
+        self._price_cache[pair] = (median_price, time.monotonic())
         return median_price
+
+    async def _timed(self, source: str, leg) -> Decimal | None:
+        """
+        Runs one price leg within its budget; a slow or failing source yields
+        None. Programming errors propagate instead of silently dropping the leg.
+        """
+        try:
+            return await asyncio.wait_for(leg, PRICE_SOURCE_TIMEOUTS_S[source])
+        except (KillSwitchActiveError, TypeError, AttributeError, NameError):
+            raise
+        except asyncio.TimeoutError:
+            log.warning("ORACLE_SOURCE_TIMEOUT", source=source)
+        except Exception as e:
+            log.warning("ORACLE_SOURCE_FAILED", source=source, error=str(e))
+        return None
+
+    async def get_user_health_factor(self, user: str) -> Decimal:
+        return Decimal(await self.get_user_health_factor_raw(user)) / TEN_18
+
+    async def get_user_health_factor_raw(self, user: str) -> int:
+        """Health factor scaled by HF_SCALE; compare against HF_SCALE without Decimal math."""
+        check()
+        # A single user goes straight to the pool: no aggregate3 wrapping or decoding
+        ret = await asyncio.to_thread(self.w3.eth.call, {"to": self.pool_address, "data": _account_data_calldata(user)})
+        return int.from_bytes(ret[_HEALTH_FACTOR_WORD], "big")
+
+    async def get_user_health_factors(self, users: list[str]) -> dict[str, Decimal]:
+        raw = await self.get_user_health_factors_raw(users)
+        return {user: Decimal(hf) / TEN_18 for user, hf in raw.items()}
+
+    async def get_user_health_factors_raw(self, users: list[str]) -> dict[str, int]:
+        """
+        Reads Aave health factors (scaled by HF_SCALE) through Multicall3: one
+        eth_call per HEALTH_FACTOR_BATCH_SIZE users instead of one per user.
+        """
+        check()
+        batches = [users[i:i + HEALTH_FACTOR_BATCH_SIZE] for i in range(0, len(users), HEALTH_FACTOR_BATCH_SIZE)]
+        results = await asyncio.gather(*(self._health_factor_batch(batch) for batch in batches))
+        return {user: hf for batch in results for user, hf in batch}
+
+    async def _health_factor_batch(self, users: list[str]) -> list[tuple[str, int]]:
+        # getUserAccountData does not revert for unknown users, so allowFailure stays off.
+        calls = [
+            (self.pool_address, False, _account_data_calldata(user))
+            for user in users
+        ]
+        data = AGGREGATE3_SELECTOR + abi_encode([AGGREGATE3_CALLS_TYPE], [calls])
+        try:
+            ret = await asyncio.to_thread(self.w3.eth.call, {"to": MULTICALL3_ADDRESS, "data": data})
+        except Exception as e:
+            log.error("HEALTH_FACTOR_BATCH_FAILED", size=len(users), error=str(e))
+            raise
+        results = abi_decode([AGGREGATE3_RESULTS_TYPE], ret)[0]
+        return [(user, int.from_bytes(out[_HEALTH_FACTOR_WORD], "big")) for user, (_, out) in zip(users, results)]
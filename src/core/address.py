@@ -0,0 +1,13 @@
+# /src/core/address.py
+# Address helpers shared by adapters that checksum user- or config-supplied addresses.
+from functools import lru_cache
+
+from eth_utils import to_checksum_address
+
+@lru_cache(maxsize=4096)
+def _checksum_lower(address: str) -> str:
+    return to_checksum_address(address)
+
+def to_checksum(address: str) -> str:
+    """EIP-55 checksums ``address``; repeat addresses in any casing are a cache hit."""
+    return _checksum_lower(address.lower())
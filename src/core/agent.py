@@ -3,10 +3,13 @@
 # Manages the full mutation lifecycle: request, check for approval, and apply.
 
 import asyncio
-import json
-import redis
+import orjson
+import msgspec
+from types import MappingProxyType
 from typing import Dict
 import re
+import time
+import hashlib
 
 from src.core.state import State
 from src.strategies.base import AbstractStrategy
@@ -14,9 +17,55 @@ from src.core.kill import check, KillSwitchActiveError
 from src.core.logger import get_logger, set_cycle_counter
 from src.core import drp
 from src.core.config import settings
+from src.core.redis_pool import get_redis
 
 log = get_logger(__name__)
 
+# Settings strategies may read through their config argument. Whitelisted so
+# keys, secrets and service URLs never reach strategy code, and scalar so the
+# read-only view cannot be mutated through a nested value.
+STRATEGY_CONFIG_FIELDS = (
+    "chain_id",
+    "UNISWAP_ROUTER_ADDRESS",
+    "SANDWICH_MIN_PROFIT",
+    "MANUAL_APPROVAL",
+    "MUTATION_TTL_SECONDS",
+)
+# Read-only view handed to every strategy cycle; built once per process
+FROZEN_CONFIG = MappingProxyType({name: getattr(settings, name) for name in STRATEGY_CONFIG_FIELDS})
+# States with a longer history are serialized on a worker thread; small ones
+# dump faster inline than the thread hand-off costs.
+STATE_DUMP_OFFLOAD_HISTORY = 64
+# msgpack state blobs; the unversioned key holds JSON written by older builds
+STATE_KEY = "state:v2:{}"
+LEGACY_STATE_KEY = "state:{}"
+# Simple regex-based guardrail to block unsafe mutation patterns (prompt injection, code exec, etc.).
+# Compiled once and case-insensitive, so proposals are scanned without a lowercased copy.
+# TODO: make configurable via settings or external policy file
+_UNSAFE_RE = re.compile(r"ignore\s+all|system\s+exit|eval\(", re.IGNORECASE)
+
+# Broadcasts in flight per bundle; keeps large bundles under node rate limits
+BUNDLE_SEND_CONCURRENCY = 8
+# An unchanged state is still rewritten after this many skipped cycles, which
+# bounds how far the persisted cycle_counter can lag.
+STATE_REWRITE_EVERY = 100
+
+def _serialize_state(state: State) -> tuple[bytes, bytes]:
+    """Returns (payload, digest); the digest ignores cycle_counter, which changes every cycle."""
+    # msgpack: smaller than JSON on the wire; Decimals travel as strings and
+    # datetimes as msgpack timestamps, both re-validated by State on restore
+    data = state.to_dict()
+    counter = data.pop("cycle_counter")
+    digest = hashlib.blake2b(msgspec.msgpack.encode(data), digest_size=16).digest()
+    data["cycle_counter"] = counter
+    return msgspec.msgpack.encode(data), digest
+
+async def _dump_state(state: State) -> tuple[bytes, bytes]:
+    # State is immutable, so the worker thread cannot see it change mid-dump
+    if len(state.history) > STATE_DUMP_OFFLOAD_HISTORY:
+        return await asyncio.to_thread(_serialize_state, state)
+    return _serialize_state(state)
+
 class CexError(Exception):
     """Generic CEX adapter error used in tests."""
     pass
@@ -27,32 +76,62 @@ class Agent:
     and AI-driven parameter mutation lifecycle.
     """
     def __init__(self, strategy: AbstractStrategy, initial_state: State, adapters: dict):
+        # No state lock: run_loop is the only writer and State is immutable, so
+        # readers always see a complete snapshot and swaps are plain assignments.
         self.strategy = strategy
-        self.redis = redis.Redis.from_url(settings.REDIS_URL)
-        self.state_lock = asyncio.Lock()
-        try:
-            saved = self.redis.get(f"state:{initial_state.session_id}")
-            if saved:
-                self.state = State.from_dict(json.loads(saved))
-            else:
-                self.state = initial_state
-        except Exception as e:
-            log.error("STATE_RESTORE_FAILED", error=str(e))
-            self.state = initial_state
+        self.redis = get_redis()
+        # Replaced by the persisted state, if any, in initialize()
+        self.state = initial_state
+        self._initialized = False
         self.adapters = adapters
+        self.config = FROZEN_CONFIG
         # Get a unique a name for logging and mutation management
         self.strategy_name = getattr(strategy, 'strategy_name', type(strategy).__name__)
         
         # Make intervals configurable or load from strategy metadata
-        self.run_interval = 60  # Run strategy logic every 60 seconds
+        self.run_interval = 60  # Upper bound between cycles; new heads trigger them sooner
+        # Contracts whose logs make a head worth a cycle (raw 20-byte addresses)
+        self._watched = tuple(bytes.fromhex(a[2:]) for a in getattr(strategy, "watched_addresses", ()))
         self.mutation_request_interval = 3600 # Request new params every hour
         self.last_mutation_request_time = 0
-        # Simple regex-based guardrail to block unsafe mutation patterns (prompt injection, code exec, etc.)
-        # TODO: make configurable via settings or external policy file
-        self._unsafe_pattern = r"ignore\s+all|system\s+exit|eval\("  # blocklist regex
-
         # Failure counter for fallback logic
         self._consecutive_failures = 0
+        # Digest of the last state written to Redis, and cycles skipped since
+        self._last_state_digest: bytes | None = None
+        self._skipped_writes = 0
+
+    async def initialize(self):
+        """Restores the last persisted state for this session, if any."""
+        if self._initialized:
+            return
+        await self._restore_state(self.state.session_id)
+        self._initialized = True
+
+    async def _restore_state(self, session_id):
+        try:
+            saved = await self.redis.get(STATE_KEY.format(session_id))
+            if saved:
+                self.state = State.from_dict(msgspec.msgpack.decode(saved))
+                return
+            legacy = await self.redis.get(LEGACY_STATE_KEY.format(session_id))
+            if legacy:
+                self.state = State.from_dict(orjson.loads(legacy))
+        except Exception as e:
+            log.error("STATE_RESTORE_FAILED", error=str(e))
+
+    async def _save_state(self, state: State):
+        payload, digest = await _dump_state(state)
+        if digest == self._last_state_digest and self._skipped_writes < STATE_REWRITE_EVERY:
+            # Nothing but the cycle counter moved: skip the round trip
+            self._skipped_writes += 1
+            return
+        await self.redis.set(STATE_KEY.format(state.session_id), payload)
+        self._last_state_digest = digest
+        self._skipped_writes = 0
+
+    async def close(self):
+        """Releases this agent's client; the shared pool stays up for other users."""
+        await self.redis.aclose(close_connection_pool=False)
 
     async def _two_phase_commit(self, trades: list):
         check()
@@ -61,21 +140,35 @@ class Agent:
             return
         txs = tx_manager.build_bundle(self.state, trades)
         tx_ids = [tx.get("id") for tx in txs]
-        async with self.state_lock:
-            self.state = self.state.mark_pending(tx_ids)
-        try:
-            for tx in txs:
-                await tx_manager.send(tx)
-            async with self.state_lock:
-                self.state = self.state.clear_pending(tx_ids)
-        except Exception:
-            async with self.state_lock:
-                self.state = self.state.clear_pending(tx_ids)
-            raise
+        self.state = self.state.mark_pending(tx_ids)
+        # Bundle legs are independent broadcasts: wall time is the slowest send, not the sum
+        slots = asyncio.Semaphore(BUNDLE_SEND_CONCURRENCY)
+
+        async def send(tx):
+            async with slots:
+                return await tx_manager.send(tx)
+
+        results = await asyncio.gather(*(send(tx) for tx in txs), return_exceptions=True)
+        self.state = self.state.clear_pending(tx_ids)
+        failed = [(tx_id, r) for tx_id, r in zip(tx_ids, results) if isinstance(r, BaseException)]
+        if failed:
+            for tx_id, error in failed:
+                log.error("AGENT_BUNDLE_SEND_FAILED", tx_id=tx_id, error=str(error))
+            raise failed[0][1]
+
+    async def _wait_next_cycle(self):
+        """Waits for a relevant new head, or run_interval when no block feed is available."""
+        heads = self.adapters.get("heads")
+        if heads is None:
+            await asyncio.sleep(self.run_interval)
+        else:
+            await heads.wait(self.run_interval, self._watched)
 
     async def run_loop(self):
         """The main async execution loop for a stateful agent."""
         log.info("STATEFUL_AGENT_STARTING_LOOP", strategy=self.strategy_name)
+        # Callers that skip initialize() still resume from the persisted state
+        await self.initialize()
 
         while True:
             try:
@@ -84,9 +177,8 @@ class Agent:
                 except KillSwitchActiveError:
                     break
                 # increment cycle counter and bind to logs
-                async with self.state_lock:
-                    self.state = self.state.copy(update={"cycle_counter": self.state.cycle_counter + 1})
-                    cycle_id = self.state.cycle_counter
+                self.state = self.state.copy(update={"cycle_counter": self.state.cycle_counter + 1})
+                cycle_id = self.state.cycle_counter
                 set_cycle_counter(cycle_id)
 
                 # 1. Check for and apply any approved mutations first
@@ -96,7 +188,7 @@ class Agent:
                 # Guardrail: inspect mutation proposal before applying
                 if mutated and hasattr(self.strategy, "pending_mutation"):
                     proposal = str(self.strategy.pending_mutation)
-                    if re.search(self._unsafe_pattern, proposal.lower()):
+                    if _UNSAFE_RE.search(proposal):
                         log.warning("AGENT_GUARDRAIL_BLOCKED_MUTATION", strategy=self.strategy_name,
                                     reason="Potential prompt injection")
                         # Drop unsafe mutation
@@ -106,23 +198,22 @@ class Agent:
                 if mutated:
                     log.warning("AGENT_APPLIED_APPROVED_MUTATION", strategy=self.strategy_name)
 
-                pre_snapshot = await drp.save_snapshot(self.state)
+                # Rollback target kept in memory; only successful cycles are persisted.
+                # Deep copy: strategies may still mutate the state's containers in place.
+                pre_snapshot = self.state.model_copy(deep=True)
                 try:
-                    result = await self.strategy.run(self.state, self.adapters, {})
+                    result = await self.strategy.run(self.state, self.adapters, self.config)
                     if isinstance(result, tuple):
-                        async with self.state_lock:
-                            self.state, trades = result
+                        self.state, trades = result
                         await self._two_phase_commit(trades)
                     else:
-                        async with self.state_lock:
-                            self.state = result
-                    async with self.state_lock:
-                        await drp.save_snapshot(self.state)
-                        self.redis.set(f"state:{self.state.session_id}", json.dumps(self.state.to_dict()))
+                        self.state = result
+                    # Disk snapshot and Redis write are independent: overlap them
+                    state = self.state
+                    await asyncio.gather(drp.save_snapshot(state), self._save_state(state))
                 except Exception as e:
                     # Roll back state to pre-snapshot
-                    async with self.state_lock:
-                        self.state = await drp.load_snapshot(pre_snapshot)
+                    self.state = pre_snapshot
                     log.error("AGENT_STRATEGY_ERROR", strategy=self.strategy_name, error=str(e))
 
                     # Increment failure count and check threshold
@@ -139,13 +230,12 @@ class Agent:
                 self._consecutive_failures = 0
 
                 # 3. Periodically request a new mutation from the LLM
-                now = asyncio.get_event_loop().time()
+                now = time.monotonic()
                 if (now - self.last_mutation_request_time) > self.mutation_request_interval:
                     log.info("AGENT_REQUESTING_NEW_MUTATION", strategy=self.strategy_name)
                     
                     if hasattr(self.strategy, 'get_performance_data'):
-                        async with self.state_lock:
-                            performance_data = self.strategy.get_performance_data(self.state)
+                        performance_data = self.strategy.get_performance_data(self.state)
                         await self.adapters['ai_model'].fetch_and_propose_mutation(self.strategy_name, performance_data)
                     else:
                         log.warning("STRATEGY_MISSING_GET_PERFORMANCE_DATA", strategy=self.strategy_name)
@@ -159,7 +249,7 @@ class Agent:
                     await self.strategy.abort(f"Handoff to {handoff_target}")
                     break
 
-                await asyncio.sleep(self.run_interval)
+                await self._wait_next_cycle()
 
             except Exception as e:
                 log.error("STATEFUL_AGENT_LOOP_ERROR", strategy=self.strategy_name, error=str(e), exc_info=True)
@@ -176,7 +266,7 @@ class Agent:
     def run(self, strategy_instance):  # type: ignore[override]
         """Executes a single strategy step synchronously (test harness)."""
         try:
-            return strategy_instance.run(self.state, self.adapters, {})  # type: ignore[arg-type]
+            return strategy_instance.run(self.state, self.adapters, self.config)  # type: ignore[arg-type]
         except AttributeError:
             # Fall back to the agent-managed strategy if caller omitted arg.
-            return self.strategy.run(self.state, self.adapters, {})  # type: ignore[arg-type]
+            return self.strategy.run(self.state, self.adapters, self.config)  # type: ignore[arg-type]
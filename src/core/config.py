@@ -3,6 +3,7 @@ import os
 from pydantic_settings import BaseSettings
 from pydantic import SecretStr
 from typing import List
+from decimal import Decimal
 
 # This is the simplified settings loader. If using Vault, the more complex
 # load_settings() function from the previous audit fix would be used here.
@@ -17,9 +18,12 @@ class Settings(BaseSettings):
     ETH_RPC_URL_3: SecretStr | None = None
     rpc_urls: List[str] = []
     MEMPOOL_WSS_URL: SecretStr | None = SecretStr("wss://dummy.local")
+    # newHeads feed that paces stateful agents; unset falls back to polling
+    ETH_WS_URL: SecretStr | None = None
 
     # Chain configuration
     chain_id: int = 1
+    UNISWAP_ROUTER_ADDRESS: str = "0x7a250d5630B4cF539739dF2C5dAcb4c659F2488D"
 
     LOG_SIGNING_KEY: SecretStr | None = None
 
@@ -40,6 +44,12 @@ class Settings(BaseSettings):
     CONTROL_API_TOKEN: str | None = None
     MUTATION_TTL_SECONDS: int = 3600
 
+    # Strategies started by main.py; only their modules are imported
+    ENABLED_STRATEGIES: List[str] = ["sandwich", "rebalancer"]
+
+    # Strategy thresholds (parsed once at boot)
+    SANDWICH_MIN_PROFIT: Decimal = Decimal("0")
+
     # GCP (optional)
     GCP_PROJECT_ID: str | None = None
     GCP_REGION: str | None = None
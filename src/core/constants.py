@@ -0,0 +1,35 @@
+# /src/core/constants.py
+# Pre-built numeric constants for hot paths. Decimal(str) parses text and
+# allocates on every call, so loops import these instead of re-creating them.
+from dataclasses import dataclass
+from decimal import Decimal
+
+from eth_utils import to_checksum_address
+
+ZERO = Decimal(0)
+ONE = Decimal(1)
+
+WEI_PER_ETH = 10**18
+GWEI = 10**9
+HF_SCALE = 10**18            # Aave health factor fixed point: < HF_SCALE is liquidatable
+TEN_8 = Decimal(10) ** 8     # Chainlink USD feed decimals
+TEN_18 = Decimal(10) ** 18
+
+AAVE_FLASHLOAN_FEE = Decimal("0.0009")
+MAX_ORACLE_DEVIATION = Decimal("0.01")
+
+
+@dataclass(frozen=True, slots=True)
+class Addresses:
+    """Well-known contract addresses, checksummed once at import."""
+    WETH: str
+    USDC: str
+    UNISWAP_V2_ROUTER: str
+    AAVE_V3_POOL: str
+
+MAINNET = Addresses(
+    WETH=to_checksum_address("0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2"),
+    USDC=to_checksum_address("0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48"),
+    UNISWAP_V2_ROUTER=to_checksum_address("0x7a250d5630B4cF539739dF2C5dAcb4c659F2488D"),
+    AAVE_V3_POOL=to_checksum_address("0x87870Bca3F3fD6335C3F4ce8392D69350B4fA4E2"),
+)
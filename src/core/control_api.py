@@ -1,3 +1,4 @@
+import asyncio
 from fastapi import FastAPI, HTTPException, Header, Depends, Body
 from src.core.kill import activate_kill_switch, deactivate_kill_switch, is_kill_switch_active
 from src.core import drp
@@ -14,13 +15,18 @@ def verify(authorization: str | None = Header(None)):
     if authorization != f"Bearer {token}":
         raise HTTPException(status_code=401, detail="Unauthorized")
 
-@app.post("/kill/toggle")
-async def toggle_kill(reason: str = "", auth: None = Depends(verify)):
+def _toggle_kill(reason: str) -> bool:
     if is_kill_switch_active():
         deactivate_kill_switch()
     else:
         activate_kill_switch(reason or "manual override")
-    return {"kill_switch_active": is_kill_switch_active()}
+    return is_kill_switch_active()
+
+@app.post("/kill/toggle")
+async def toggle_kill(reason: str = "", auth: None = Depends(verify)):
+    # Backend writes and the Redis publish are blocking; keep them off the loop
+    active = await asyncio.to_thread(_toggle_kill, reason)
+    return {"kill_switch_active": active}
 
 @app.post("/drp/restore")
 async def restore(snapshot_path: str = Body(..., embed=True), auth: None = Depends(verify)):
@@ -1,23 +1,29 @@
 from __future__ import annotations
-import json
+import asyncio
 import aiofiles
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
 from src.core.state import State
 from src.core.logger import get_logger, SNAPSHOTS_TAKEN
 from src.core.config import settings
+from src.core.fs import ensure_dir
 
 log = get_logger(__name__)
 SNAPSHOT_DIR = Path(settings.SESSION_DIR) / "snapshots"
+# Snapshot (de)serialization runs here, off the event loop and out of the
+# default executor that other blocking calls share.
+_SERIALIZER = ThreadPoolExecutor(max_workers=2, thread_name_prefix="drp")
 
 async def save_snapshot(state: State) -> str:
     """Persist state to a timestamped JSON snapshot."""
-    SNAPSHOT_DIR.mkdir(parents=True, exist_ok=True)
+    ensure_dir(SNAPSHOT_DIR)
     ts = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
     path = SNAPSHOT_DIR / f"{state.session_id}_{ts}.json"
+    payload = await asyncio.get_running_loop().run_in_executor(_SERIALIZER, _dump_json, state)
     async with aiofiles.open(path, "w") as f:
-        await f.write(state.model_dump_json(indent=2))
+        await f.write(payload)
     SNAPSHOTS_TAKEN.inc()
     ttl = getattr(settings, "MUTATION_TTL_SECONDS", 0)
     if ttl:
@@ -32,5 +38,8 @@ async def load_snapshot(path: str) -> State:
     """Load a snapshot file back into a State object."""
     async with aiofiles.open(path, "r") as f:
         data = await f.read()
-    obj = json.loads(data)
-    return State.model_validate(obj)
+    # Parse and validate in one pass with State's prebuilt core validator
+    return await asyncio.get_running_loop().run_in_executor(_SERIALIZER, State.model_validate_json, data)
+
+def _dump_json(state: State) -> str:
+    return state.model_dump_json(indent=2)
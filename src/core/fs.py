@@ -0,0 +1,12 @@
+# /src/core/fs.py
+# Filesystem helpers shared by modules that persist session data.
+import os
+
+_ENSURED_DIRS: set[str] = set()
+
+def ensure_dir(path) -> None:
+    """Creates ``path`` (mkdir -p) once per process; repeat calls are a set lookup."""
+    path = os.fspath(path)
+    if path not in _ENSURED_DIRS:
+        os.makedirs(path, exist_ok=True)
+        _ENSURED_DIRS.add(path)
@@ -7,6 +7,7 @@ from web3 import Web3
 
 from src.core.resilient_rpc import ResilientWeb3Provider # Use our async, multi-node provider
 from src.core.logger import get_logger
+from src.core.constants import GWEI
 from src.core.decorators import retriable_network_call
 
 log = get_logger(__name__)
@@ -38,7 +39,7 @@ class GasEstimator:
         except Exception:
             # Fallback for nodes that don't support it
             log.warning("MAX_PRIORITY_FEE_RPC_UNSUPPORTED_FALLING_BACK")
-            return int(Decimal("1.5") * 10**9) # Fallback to 1.5 gwei
+            return 15 * GWEI // 10 # Fallback to 1.5 gwei
 
     async def estimate_eip1559_fees(self, priority_multiplier: Decimal = Decimal("1.2")) -> dict:
         """
@@ -0,0 +1,102 @@
+# /src/core/heads.py
+# Push-based block clock: follows an eth_subscribe("newHeads") feed so cycle
+# loops wake once per block instead of on a fixed polling interval.
+import asyncio
+import orjson
+from eth_utils import keccak
+from websockets.exceptions import ConnectionClosed
+try:
+    from websockets.asyncio.client import connect as ws_connect
+except ImportError:  # pragma: no cover – older websockets only ships the legacy client
+    from websockets import connect as ws_connect
+
+from src.core.config import settings
+from src.core.logger import get_logger
+
+log = get_logger(__name__)
+
+_SUBSCRIBE_MSG = orjson.dumps({"id": 1, "method": "eth_subscribe", "params": ["newHeads"]}).decode()
+RECONNECT_DELAY_S = 1.0
+MAX_RECONNECT_DELAY_S = 30.0
+
+def bloom_contains(bloom: bytes, item: bytes) -> bool:
+    """True if ``item`` (an address or topic) may have been logged in a 2048-bit logsBloom."""
+    digest = keccak(item)
+    for i in (0, 2, 4):
+        bit = ((digest[i] << 8) | digest[i + 1]) & 2047
+        if not bloom[255 - bit // 8] & (1 << (bit % 8)):
+            return False
+    return True
+
+class HeadWatcher:
+    """
+    Shares one newHeads subscription between any number of waiters. Waiters
+    fall back to their own timeout, so a dead or unconfigured feed degrades
+    to plain polling.
+    """
+    def __init__(self, url: str | None = None):
+        if url is None and settings.ETH_WS_URL is not None:
+            url = settings.ETH_WS_URL.get_secret_value()
+        self.url = url
+        self.latest: dict | None = None
+        self._logs_bloom: bytes | None = None
+        # Replaced on every head: setting the old event wakes everyone waiting on it
+        self._next_head = asyncio.Event()
+
+    async def run(self):
+        """
+        Long-running task: follows newHeads, reconnecting after disconnects.
+        Any other failure (handshake rejection, malformed frame) is logged and
+        retried with exponential backoff, so the task itself never dies.
+        """
+        if not self.url:
+            log.warning("HEAD_WATCHER_DISABLED_NO_WS_URL")
+            return
+        delay = RECONNECT_DELAY_S
+        while True:
+            try:
+                async with ws_connect(self.url, compression=None) as ws:
+                    await ws.send(_SUBSCRIBE_MSG)
+                    await ws.recv()  # subscription id
+                    log.info("HEAD_WATCHER_SUBSCRIBED")
+                    delay = RECONNECT_DELAY_S
+                    async for message in ws:
+                        params = orjson.loads(message).get("params")
+                        if params:
+                            self.on_head(params["result"])
+            except (ConnectionClosed, OSError) as e:
+                log.warning("HEAD_WATCHER_DISCONNECTED", error=str(e))
+            except Exception as e:
+                log.error("HEAD_WATCHER_FAILED", error=str(e), exc_info=True)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, MAX_RECONNECT_DELAY_S)
+
+    def on_head(self, head: dict):
+        self.latest = head
+        self._logs_bloom = None
+        event, self._next_head = self._next_head, asyncio.Event()
+        event.set()
+
+    def touches(self, items: tuple[bytes, ...]) -> bool:
+        """True if the latest head's logsBloom may contain any of ``items``."""
+        if self.latest is None:
+            return True
+        if self._logs_bloom is None:
+            self._logs_bloom = bytes.fromhex(self.latest["logsBloom"][2:])
+        return any(bloom_contains(self._logs_bloom, item) for item in items)
+
+    async def wait(self, timeout: float, watched: tuple[bytes, ...] = ()) -> bool:
+        """
+        Waits for the next head whose logs may involve ``watched`` (any head if
+        empty); returns False once ``timeout`` seconds pass without one.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while (remaining := deadline - loop.time()) > 0:
+            try:
+                await asyncio.wait_for(self._next_head.wait(), remaining)
+            except asyncio.TimeoutError:
+                return False
+            if not watched or self.touches(watched):
+                return True
+        return False
@@ -1,9 +1,12 @@
 # /src/core/kill.py - HARDENED with GCS backend
 import os
+import asyncio
+import redis
 from datetime import datetime, timezone
 from google.cloud import storage
 from google.api_core.exceptions import GoogleAPICallError
 from src.core.config import settings
+from src.core.redis_pool import get_redis
 from src.core.logger import get_logger, KILL_TRIGGERED
 import sentry_sdk
 
@@ -14,16 +17,32 @@ GCS_BUCKET_NAME = f"{settings.GCP_PROJECT_ID}-mev-og-state" if IS_GCP_CONFIGURED
 KILL_SWITCH_BLOB_NAME = "SYSTEM_KILL_SWITCH"
 LOCAL_KILL_SWITCH_FILE = ".system_kill_activated"
 KILL_SWITCH_FILE = LOCAL_KILL_SWITCH_FILE
+# Refresh cadence per backend: a local stat is cheap, a GCS read is a billed
+# network call. Fast propagation between processes comes from KILL_CHANNEL.
+KILL_REFRESH_INTERVAL_S = 0.02
+GCS_KILL_REFRESH_INTERVAL_S = 1.0
+# Redis pub/sub channel announcing toggles, so other processes flip without waiting for a poll
+KILL_CHANNEL = "kill_channel"
+
+# Last state seen by run_kill_refresher(); None while no refresher is running,
+# in which case check() falls back to reading the backend directly.
+_cached_active: bool | None = None
+# One GCS client per process; building one per read costs an auth round trip
+_gcs_client = None
 
 class KillSwitchActiveError(Exception):
     """Raised when the global kill switch is engaged."""
     pass
 
 def get_gcs_client():
+    global _gcs_client
     if not IS_GCP_CONFIGURED:
         return None
+    if _gcs_client is not None:
+        return _gcs_client
     try:
-        return storage.Client()
+        _gcs_client = storage.Client()
+        return _gcs_client
     except Exception as e:
         log.critical("GCS_CLIENT_INITIALIZATION_FAILED", error=str(e))
         return None
@@ -54,11 +73,15 @@ def activate_kill_switch(reason: str):
             blob = bucket.blob(KILL_SWITCH_BLOB_NAME)
             blob.upload_from_string(content, content_type="text/plain")
             log.critical("GCS_KILL_SWITCH_ACTIVATED", reason=reason, bucket=GCS_BUCKET_NAME)
+            _set_cached(True)
+            _publish(True)
         except GoogleAPICallError as e:
             log.critical("GCS_KILL_SWITCH_ACTIVATION_FAILED", error=str(e))
     else:
         with open(LOCAL_KILL_SWITCH_FILE, "w") as f: f.write(content)
         log.critical("LOCAL_KILL_SWITCH_ACTIVATED", reason=reason)
+        _set_cached(True)
+        _publish(True)
 
 def deactivate_kill_switch():
     client = get_gcs_client()
@@ -69,15 +92,82 @@ def deactivate_kill_switch():
             if blob.exists():
                 blob.delete()
             log.critical("GCS_KILL_SWITCH_DEACTIVATED")
+            _set_cached(False)
+            _publish(False)
         except GoogleAPICallError as e:
             log.critical("GCS_KILL_SWITCH_DEACTIVATION_FAILED", error=str(e))
     else:
         if os.path.exists(LOCAL_KILL_SWITCH_FILE):
             os.remove(LOCAL_KILL_SWITCH_FILE)
             log.critical("LOCAL_KILL_SWITCH_DEACTIVATED")
+        _set_cached(False)
+        _publish(False)
+
+def _set_cached(active: bool):
+    """Applies in-process toggles immediately instead of waiting for the next refresh."""
+    global _cached_active
+    if _cached_active is not None:
+        _cached_active = active
+
+def _publish(active: bool):
+    """
+    Best-effort push to other processes; their refreshers remain the fallback.
+    Blocking: async callers run the toggle in a worker thread.
+    """
+    try:
+        with redis.Redis.from_url(settings.REDIS_URL, socket_timeout=0.2, socket_connect_timeout=0.2) as client:
+            client.publish(KILL_CHANNEL, b"1" if active else b"0")
+    except redis.RedisError as e:
+        log.warning("KILL_SWITCH_PUBLISH_FAILED", error=str(e))
+
+async def run_kill_subscriber(retry_delay: float = 1.0):
+    """
+    Long-running task applying toggles published on KILL_CHANNEL to the
+    refresher's cached flag, so activation elsewhere lands in about one
+    Redis round trip instead of one poll interval.
+    """
+    while True:
+        client = get_redis()
+        try:
+            async with client.pubsub() as pubsub:
+                await pubsub.subscribe(KILL_CHANNEL)
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        _set_cached(message["data"] == b"1")
+        except redis.RedisError as e:
+            log.warning("KILL_SWITCH_SUBSCRIBER_DISCONNECTED", error=str(e))
+        finally:
+            await client.aclose(close_connection_pool=False)
+        await asyncio.sleep(retry_delay)
+
+async def run_kill_refresher(interval: float | None = None):
+    """
+    Long-running task that polls the backend once per ``interval`` so check()
+    on hot paths is a flag read. Worst-case staleness is one interval, or one
+    Redis round trip while run_kill_subscriber() is connected.
+    """
+    global _cached_active
+    if interval is None:
+        interval = GCS_KILL_REFRESH_INTERVAL_S if IS_GCP_CONFIGURED else KILL_REFRESH_INTERVAL_S
+    try:
+        while True:
+            try:
+                if IS_GCP_CONFIGURED:
+                    # GCS reads are blocking network calls
+                    _cached_active = await asyncio.to_thread(is_kill_switch_active)
+                else:
+                    _cached_active = is_kill_switch_active()
+            except Exception as e:
+                # Keep serving the last known state; dying here would send every
+                # check() back to synchronous backend reads.
+                log.error("KILL_SWITCH_REFRESH_FAILED", error=str(e), exc_info=True)
+            await asyncio.sleep(interval)
+    finally:
+        _cached_active = None
 
 def check():
-    if is_kill_switch_active():
+    active = _cached_active if _cached_active is not None else is_kill_switch_active()
+    if active:
         KILL_TRIGGERED.inc()
         sentry_sdk.capture_message("Kill switch triggered")
         log.critical("KILL_SWITCH_TRIGGERED")
@@ -1,5 +1,5 @@
 import asyncio
-import json
+import orjson
 import os
 import difflib
 import time
@@ -19,6 +19,11 @@ import sentry_sdk
 log = get_logger(__name__)
 APPROVAL_FILE = os.path.join(settings.SESSION_DIR, "manual_mutation.approved")
 APPROVAL_DIR = os.path.join(settings.SESSION_DIR, "mutation_approvals")
+_PARAMS_DUMP_OPTS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+
+def _dump_params(strategy) -> str:
+    params = getattr(strategy, "get_params", lambda: deepcopy(strategy.__dict__))()
+    return orjson.dumps(params, default=str, option=_PARAMS_DUMP_OPTS).decode()
 
 async def sandboxed_mutate(strategy, state, adapters):
     """Execute strategy.mutate in a sandbox with DRP snapshots and audit."""
@@ -29,17 +34,17 @@ async def sandboxed_mutate(strategy, state, adapters):
     check()
     MUTATION_ATTEMPT.inc()
     pre = await drp.save_snapshot(state)
-    before = json.dumps(getattr(strategy, "get_params", lambda: deepcopy(strategy.__dict__))(), sort_keys=True, default=str)
+    before = _dump_params(strategy)
     result = await strategy.mutate(adapters)
-    after = json.dumps(getattr(strategy, "get_params", lambda: deepcopy(strategy.__dict__))(), sort_keys=True, default=str)
+    after = _dump_params(strategy)
     post = await drp.save_snapshot(state)
     diff = list(difflib.unified_diff(before.splitlines(), after.splitlines()))
     log.warning("MUTATION", diff=diff, pre_snapshot=pre, post_snapshot=post)
     sentry_sdk.capture_message("Mutation executed")
+    ttl = getattr(settings, "MUTATION_TTL_SECONDS", 0)
     if settings.MANUAL_APPROVAL:
         log.warning("AWAITING_MANUAL_APPROVAL")
         start = time.time()
-        ttl = getattr(settings, "MUTATION_TTL_SECONDS", 0)
         while not os.path.exists(APPROVAL_FILE):
             await asyncio.sleep(1)
             if ttl and time.time() - start > ttl:
@@ -51,7 +56,6 @@ async def sandboxed_mutate(strategy, state, adapters):
         os.remove(APPROVAL_FILE)
 
     now = time.time()
-    ttl = getattr(settings, "MUTATION_TTL_SECONDS", 0)
     if ttl:
         for fname in os.listdir(APPROVAL_DIR):
             if fname.endswith(".pending.json"):
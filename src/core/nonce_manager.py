@@ -1,51 +1,89 @@
 # /src/core/nonce_manager.py
 
-import os, fcntl, aiofiles
+import os, fcntl, mmap, struct, asyncio
 from web3 import Web3
 from src.core.config import settings
+from src.core.fs import ensure_dir
 from src.core.logger import get_logger
 
 log = get_logger(__name__)
 
+# The live nonce is a little-endian uint64 in a memory-mapped state file, so a
+# bump is a plain memory store; msync to disk happens off the event loop.
+_NONCE_STRUCT = struct.Struct("<Q")
+
 class NonceManager:
     def __init__(self, w3: Web3, address: str):
         self.w3 = w3
         self.address = address
-        os.makedirs(settings.SESSION_DIR, exist_ok=True)
-        self._fd = None
+        ensure_dir(settings.SESSION_DIR)
+        self._lock_fd: int | None = None
+        self._state_fd: int | None = None
+        self._mmap: mmap.mmap | None = None
         self.nonce = -1
-        self._nonce_file = os.path.join(settings.SESSION_DIR, "nonce.lock")
+        self._dirty = False
+        self._flusher: asyncio.Task | None = None
+        # nonce.lock is a zero-byte flock sentinel; the payload lives in nonce.state
+        self._lock_file = os.path.join(settings.SESSION_DIR, "nonce.lock")
+        self._state_file = os.path.join(settings.SESSION_DIR, "nonce.state")
 
     async def initialize(self):
-        self._fd = open(self._nonce_file, "a+")
-        fcntl.flock(self._fd, fcntl.LOCK_EX)
-        self._fd.seek(0)
-        data = self._fd.read().strip()
-        if data.isdigit():
-            self.nonce = int(data)
-            log.info("NONCE_LOADED", nonce=self.nonce)
-        else:
-            self.nonce = await self.w3.eth.get_transaction_count(self.address)
-            log.info("NONCE_FROM_RPC", nonce=self.nonce)
-            await self._write()
+        self._lock_fd = os.open(self._lock_file, os.O_RDWR | os.O_CREAT, 0o600)
+        # Blocks until another process releases the lock; wait in a worker thread
+        await asyncio.to_thread(fcntl.flock, self._lock_fd, fcntl.LOCK_EX)
+        self._state_fd = os.open(self._state_file, os.O_RDWR | os.O_CREAT, 0o600)
+        if os.fstat(self._state_fd).st_size < _NONCE_STRUCT.size:
+            os.ftruncate(self._state_fd, _NONCE_STRUCT.size)
+        self._mmap = mmap.mmap(self._state_fd, _NONCE_STRUCT.size, access=mmap.ACCESS_WRITE)
+
+        # Reconcile with the node: the stored value may lag by the last
+        # unflushed bumps, while the pending count covers every broadcast tx.
+        stored = _NONCE_STRUCT.unpack_from(self._mmap, 0)[0]
+        chain = await asyncio.to_thread(self.w3.eth.get_transaction_count, self.address, "pending")
+        self.nonce = max(stored, chain)
+        log.info("NONCE_LOADED", nonce=self.nonce, stored=stored, chain=chain)
+        _NONCE_STRUCT.pack_into(self._mmap, 0, self.nonce)
+        await self._write()
         return self.nonce
 
     async def get(self) -> int:
         return self.nonce
 
     async def bump(self):
+        # Persistence is coalesced: bumps landing while a write is in flight
+        # are folded into a single follow-up write of the latest value.
         self.nonce += 1
-        await self._write()
+        _NONCE_STRUCT.pack_into(self._mmap, 0, self.nonce)
+        self._dirty = True
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.create_task(self._flush_loop())
         log.debug("NONCE_BUMPED", nonce=self.nonce)
 
+    async def flush(self):
+        """Waits until the latest nonce has been persisted."""
+        if self._flusher is not None:
+            await self._flusher
+
+    async def _flush_loop(self):
+        while self._dirty:
+            self._dirty = False
+            await self._write()
+
     async def _write(self):
-        self._fd.seek(0)
-        self._fd.truncate()
-        self._fd.write(str(self.nonce))
-        self._fd.flush()
+        # The msync runs off the event loop so strategies keep running.
+        await asyncio.to_thread(self._mmap.flush)
 
     def close(self):
-        if self._fd:
-            fcntl.flock(self._fd, fcntl.LOCK_UN)
-            self._fd.close()
+        """Releases the lock; callers should await flush() first."""
+        if self._mmap is not None:
+            self._mmap.flush()
+            self._mmap.close()
+            self._mmap = None
+        if self._state_fd is not None:
+            os.close(self._state_fd)
+            self._state_fd = None
+        if self._lock_fd is not None:
+            fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+            os.close(self._lock_fd)
+            self._lock_fd = None
             log.info("NONCE_LOCK_RELEASED")
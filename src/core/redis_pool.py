@@ -0,0 +1,23 @@
+# /src/core/redis_pool.py
+# One async Redis connection pool per process, shared by the agents, the
+# transaction manager and the kill-switch subscriber.
+import redis.asyncio as aioredis
+
+from src.core.config import settings
+
+MAX_CONNECTIONS = 32
+
+# Blocking pool: a burst past MAX_CONNECTIONS waits for a free connection
+# instead of failing. TCP keepalive and periodic health checks keep idle
+# connections usable across long gaps between cycles.
+POOL = aioredis.BlockingConnectionPool.from_url(
+    settings.REDIS_URL,
+    max_connections=MAX_CONNECTIONS,
+    timeout=5,
+    socket_keepalive=True,
+    health_check_interval=30,
+)
+
+def get_redis() -> aioredis.Redis:
+    """A client over the shared pool; closing it leaves the pool's connections open."""
+    return aioredis.Redis(connection_pool=POOL)
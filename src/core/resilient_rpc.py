@@ -1,7 +1,10 @@
 # /src/core/resilient_rpc.py
 # New module to provide a resilient, multi-node Web3 provider.
 
+import asyncio
 from collections import Counter
+import httpx
+import orjson
 from web3 import Web3
 # --- POA middleware import across Web3 versions ---
 try:
@@ -76,3 +79,48 @@ class ResilientWeb3Provider:
             
         log.debug("RPC_CONSENSUS_SUCCESS", result=result, count=count, total=len(results))
         return result
+
+    async def batch_call_consensus(
+        self, client: httpx.AsyncClient, calls: list[tuple[str, bytes]], block: str = "latest"
+    ) -> list[bytes]:
+        """
+        Runs several (to, calldata) eth_calls as one JSON-RPC batch per node,
+        all nodes queried concurrently; each call needs a majority answer.
+        Posts through the caller's pooled ``client`` rather than a session of its own.
+        """
+        body = orjson.dumps([
+            {"jsonrpc": "2.0", "id": i, "method": "eth_call", "params": [{"to": to, "data": "0x" + data.hex()}, block]}
+            for i, (to, data) in enumerate(calls)
+        ])
+        urls = [p.provider.endpoint_uri for p in self.providers]
+        replies = await asyncio.gather(*(self._post_batch(client, url, body) for url in urls), return_exceptions=True)
+        per_node = []
+        for url, reply in zip(urls, replies):
+            if isinstance(reply, Exception):
+                log.error("RPC_CONSENSUS_BATCH_FAILED", url=url, error=str(reply))
+                continue
+            by_id = {r.get("id"): r.get("result") for r in reply}
+            per_node.append([by_id.get(i) for i in range(len(calls))])
+        if not per_node:
+            raise Exception("Consensus batch failed on all RPC nodes.")
+
+        results = []
+        for i, answers in enumerate(zip(*per_node)):
+            answers = [a for a in answers if a is not None]
+            if not answers:
+                raise Exception(f"Consensus batch call {i} failed on all RPC nodes.")
+            result, count = Counter(answers).most_common(1)[0]
+            if count <= len(answers) / 2:
+                raise Exception(f"Consensus failed for batch call {i}: No majority result. Results: {answers}")
+            results.append(bytes.fromhex(result[2:]))
+        log.debug("RPC_CONSENSUS_BATCH_SUCCESS", calls=len(calls), nodes=len(per_node))
+        return results
+
+    @staticmethod
+    async def _post_batch(client: httpx.AsyncClient, url: str, body: bytes) -> list:
+        resp = await client.post(url, content=body, headers={"Content-Type": "application/json"})
+        reply = orjson.loads(resp.content)
+        if not isinstance(reply, list):
+            # Nodes answer a rejected batch with a single error object
+            raise Exception(f"Batch rejected: {reply}")
+        return reply
@@ -3,10 +3,10 @@ import uuid
 from datetime import datetime, timezone
 from decimal import Decimal
 from typing import Dict, List, Any, Set
-from pydantic import BaseModel, Field, PrivateAttr
-import asyncio
+from pydantic import BaseModel, Field
 
 from src.core.logger import get_logger
+from src.core.constants import ZERO
 
 log = get_logger(__name__)
 
@@ -24,7 +24,6 @@ class State(BaseModel):
     # --- IDEMPOTENCY FIX ---
     pending_transfers: Set[str] = Field(default_factory=set)
     cycle_counter: int = 0
-    _lock: asyncio.Lock = PrivateAttr(default_factory=asyncio.Lock)
 
     class Config:
         arbitrary_types_allowed = True
@@ -43,7 +42,7 @@ class State(BaseModel):
     def update_capital(self, capital_changes: Dict[str, Decimal]) -> 'State':
         new_capital = self.capital_base.copy()
         for asset, change in capital_changes.items():
-            new_capital[asset] = new_capital.get(asset, Decimal("0")) + change
+            new_capital[asset] = new_capital.get(asset, ZERO) + change
         log.info("CAPITAL_UPDATED", session_id=str(self.session_id), changes=capital_changes, new_balances=new_capital)
         return self.copy(update={"capital_base": new_capital})
         
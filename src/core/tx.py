@@ -2,9 +2,9 @@
 # FINAL VERSION: Full async, uses resilient provider and durable nonce manager.
 import asyncio
 from typing import Dict, Any
-import redis.asyncio as aioredis
 
 from src.core.config import settings
+from src.core.redis_pool import get_redis
 from src.core.kill import check, KillSwitchActiveError
 from src.core.logger import get_logger
 from src.core.resilient_rpc import ResilientWeb3Provider
@@ -31,7 +31,9 @@ class TransactionManager:
             self.account = type("A", (), {"key": "0x0"})()
             self.address = "0xStub"
         self.nonce_manager = NonceManager(self.w3, self.address)
-        self.redis = aioredis.from_url(settings.REDIS_URL)
+        self.redis = get_redis()
+        # Resolved once; read on every transaction build
+        self.chain_id = settings.chain_id
         self.is_initialized = False
 
     async def initialize(self):
@@ -61,22 +63,33 @@ class TransactionManager:
                 full_tx_params = {
                     'from': self.address,
                     'nonce': current_nonce,
-                    'chainId': settings.chain_id,
+                    'chainId': self.chain_id,
                     **tx_params
                 }
 
-                # Estimate gas if not provided
-                if 'gas' not in full_tx_params:
-                    full_tx_params['gas'] = await self.w3.eth.estimate_gas(full_tx_params)
-
-                # Set default EIP-1559 fees if not provided
-                if 'maxFeePerGas' not in full_tx_params:
-                    gas_price = await self.w3.eth.gas_price()
-                    full_tx_params['maxFeePerGas'] = gas_price * 2
-                    full_tx_params['maxPriorityFeePerGas'] = await self.w3.eth.max_priority_fee()
+                # Gas estimate and default EIP-1559 fees are independent reads; fetch
+                # whichever are missing concurrently instead of one round trip each.
+                # The provider is a sync Web3, so each read runs in a worker thread.
+                eth = self.w3.eth
+                missing_gas = 'gas' not in full_tx_params
+                missing_fees = 'maxFeePerGas' not in full_tx_params
+                reads = []
+                if missing_gas:
+                    reads.append(asyncio.to_thread(eth.estimate_gas, full_tx_params))
+                if missing_fees:
+                    reads.append(asyncio.to_thread(lambda: eth.gas_price))
+                    reads.append(asyncio.to_thread(lambda: eth.max_priority_fee))
+                results = iter(await asyncio.gather(*reads))
+                if missing_gas:
+                    full_tx_params['gas'] = next(results)
+                if missing_fees:
+                    full_tx_params['maxFeePerGas'] = next(results) * 2
+                    full_tx_params['maxPriorityFeePerGas'] = next(results)
 
                 signed_tx = self.w3.eth.account.sign_transaction(full_tx_params, self.account.key)
-                tx_hash = await self.w3.eth.send_raw_transaction(signed_tx.rawTransaction)
+                # Never broadcast ahead of durability: earlier bumps must be on disk first
+                await self.nonce_manager.flush()
+                tx_hash = await asyncio.to_thread(eth.send_raw_transaction, signed_tx.rawTransaction)
 
                 # Increment durable nonce ONLY on successful broadcast
                 await self.nonce_manager.bump()
@@ -90,5 +103,6 @@ class TransactionManager:
 
     async def close(self):
         """Closes resources like the nonce file lock."""
-        await self.redis.close()
+        await self.redis.aclose(close_connection_pool=False)
+        await self.nonce_manager.flush()
         self.nonce_manager.close()
@@ -16,6 +16,8 @@ getcontext().prec = 50
 
 log = get_logger(__name__)
 
+DEX_SPREAD_FACTOR = Decimal("1.001")
+
 # --- Asset Naming Convention ---
 # To track capital across venues, we use a convention:
 # "ASSET_VENUE", e.g., "WETH_ONCHAIN", "USDT_BINANCE"
@@ -68,7 +70,7 @@ class CexDexArbitrageStrategy(AbstractStrategy):
             # We need to calculate the price to BUY WETH on the DEX.
             # Simplified: Let's assume DEX buy price is close to DEX sell price for now. A real
             # implementation would need a quote for USDC->WETH as well.
-            dex_buy_price = dex_sell_price * Decimal("1.001") # Simulate 0.1% spread
+            dex_buy_price = dex_sell_price * DEX_SPREAD_FACTOR # Simulate 0.1% spread
             
             profit_per_unit = cex_price - dex_buy_price
             estimated_profit = profit_per_unit * self.trade_amount
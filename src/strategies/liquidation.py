@@ -11,11 +11,65 @@ from src.adapters.oracle import OracleAdapter
 from src.adapters.dex import DexAdapter
 from src.adapters.flashloan import FlashloanAdapter
 from src.core.gas_estimator import GasEstimator
+from src.core.heads import HeadWatcher
+from src.core.address import to_checksum
+from src.abis.aave_v3 import SUPPLY_TOPIC, BORROW_TOPIC, REPAY_TOPIC, WITHDRAW_TOPIC
+from src.core.constants import TEN_18, HF_SCALE, AAVE_FLASHLOAN_FEE
 from src.core.logger import get_logger
 
 log = get_logger(__name__)
 # ... (AAVE_LIQUIDATION_ABI remains the same)
 
+_POSITION_TOPICS = frozenset({SUPPLY_TOPIC, BORROW_TOPIC, REPAY_TOPIC, WITHDRAW_TOPIC})
+
+def _topic_bytes(topic) -> bytes:
+    return bytes.fromhex(topic[2:]) if isinstance(topic, str) else bytes(topic)
+
+class AaveUserIndex:
+    """
+    Remembers which reserves each Aave user has touched, so a block only
+    re-scans users exposed to a token whose Chainlink feed updated in it.
+    Entries are never dropped on Repay/Withdraw: a stale entry costs one
+    extra read, a missing one a missed liquidation.
+    """
+    def __init__(self, price_feeds: dict[str, str]):
+        # (aggregator as raw bytes for logsBloom checks, reserve token it prices)
+        self._feeds = [(bytes.fromhex(agg[2:]), to_checksum(token)) for agg, token in price_feeds.items()]
+        self.user_tokens: dict[str, set[str]] = {}
+        # raw 20-byte address -> checksummed form; each address is checksummed once
+        # for the index's lifetime, however many user sets outgrow the shared LRU
+        self._checksummed: dict[bytes, str] = {}
+
+    def apply_log(self, entry: dict):
+        """Feeds one Aave pool log (eth_getLogs / logs subscription shape)."""
+        topics = [_topic_bytes(t) for t in entry["topics"][:3]]
+        if len(topics) < 3 or topics[0] not in _POSITION_TOPICS:
+            return
+        reserve = self._address(topics[1][12:])
+        user = self._address(topics[2][12:])
+        self.user_tokens.setdefault(user, set()).add(reserve)
+
+    def _address(self, raw: bytes) -> str:
+        address = self._checksummed.get(raw)
+        if address is None:
+            address = self._checksummed[raw] = to_checksum("0x" + raw.hex())
+        return address
+
+    def dirty_tokens(self, heads: HeadWatcher) -> set[str]:
+        """Reserves whose price feed may have posted an answer in the latest head."""
+        return {token for agg, token in self._feeds if heads.touches((agg,))}
+
+    def candidates(self, dirty: set[str]) -> list[str]:
+        return [user for user, tokens in self.user_tokens.items() if not tokens.isdisjoint(dirty)]
+
+    async def liquidatable(self, oracle: OracleAdapter, heads: HeadWatcher) -> list[str]:
+        """Users below a health factor of 1, reading only those exposed to this block's price moves."""
+        users = self.candidates(self.dirty_tokens(heads))
+        if not users:
+            return []
+        factors = await oracle.get_user_health_factors_raw(users)
+        return [user for user, hf in factors.items() if hf < HF_SCALE]
+
 class LiquidationStrategy(AbstractStrategy):
     """
     An ASYNCHRONOUS strategy that finds and executes liquidations.
@@ -30,11 +84,11 @@ class LiquidationStrategy(AbstractStrategy):
 
     async def run(self, state: State, adapters: dict, config: dict, target_user: str, preset_assets: dict) -> State:
         # 1. Check health factor
-        health_factor = await self.oracle.get_user_health_factor(target_user)
-        if health_factor >= Decimal("1.0"):
+        health_factor_raw = await self.oracle.get_user_health_factor_raw(target_user)
+        if health_factor_raw >= HF_SCALE:
             return state
 
-        log.warning("LIQUIDATABLE_TARGET_FOUND", user=target_user, health_factor=health_factor)
+        log.warning("LIQUIDATABLE_TARGET_FOUND", user=target_user, health_factor=Decimal(health_factor_raw) / TEN_18)
         
         try:
             # 2. Simulate & Calculate Profit/Loss
@@ -50,12 +104,12 @@ class LiquidationStrategy(AbstractStrategy):
             
             # Estimate costs
             eth_price_usd = await self.oracle.get_price("ETH/USD")
-            flashloan_fee = Decimal(debt_to_cover) * Decimal("0.0009") # Aave fee
+            flashloan_fee = Decimal(debt_to_cover) * AAVE_FLASHLOAN_FEE # Aave fee
             
             # Realistic Gas Cost Calculation
             estimated_gas_units = 500_000 # A conservative estimate for a flash loan + liquidate + swap
             fees = await self.gas_estimator.estimate_eip1559_fees()
-            gas_cost_eth = Decimal(fees['maxFeePerGas'] * estimated_gas_units) / 10**18
+            gas_cost_eth = Decimal(fees['maxFeePerGas'] * estimated_gas_units) / TEN_18
             gas_cost_usd = gas_cost_eth * eth_price_usd
             
             total_cost = gas_cost_usd + flashloan_fee # Assuming debt asset is USD-pegged
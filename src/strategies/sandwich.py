@@ -9,10 +9,37 @@ from src.adapters.oracle import OracleAdapter # Fixed
 from src.core.logger import get_logger
 from src.core.drp import save_snapshot, load_snapshot # Fixed
 from src.core.kill import check, KillSwitchActiveError
-from src.abis.uniswap_v2 import UNISWAP_V2_ROUTER_ABI
+from src.abis.uniswap_v2 import UNISWAP_V2_ROUTER_ABI, SWAP_EXACT_TOKENS_FOR_TOKENS_SELECTOR
+from src.core.constants import MAINNET
 
 log = get_logger(__name__)
-UNISWAP_V2_ROUTER = "0x7a250d5630B4cF539739dF2C5dAcb4c659F2488D"
+UNISWAP_V2_ROUTER = MAINNET.UNISWAP_V2_ROUTER
+# Mempool `to` fields are compared lowercase; normalise the router once, not per tx
+_UNISWAP_V2_ROUTER_LOWER = UNISWAP_V2_ROUTER.lower()
+_SWAP_EXACT_TOKENS_SELECTOR_HEX = "0x" + SWAP_EXACT_TOKENS_FOR_TOKENS_SELECTOR.hex()
+
+def decode_swap_exact_tokens(calldata: str) -> dict:
+    """
+    Hand-decodes swapExactTokensForTokens calldata by slicing 32-byte words,
+    avoiding web3's generic ABI decoder on the mempool hot path.
+    Addresses are returned lowercase.
+    """
+    args = bytes.fromhex(calldata[10:])
+
+    def word(i: int) -> bytes:
+        return args[32 * i:32 * (i + 1)]
+
+    path_offset = int.from_bytes(word(2), "big") // 32
+    path_len = int.from_bytes(word(path_offset), "big")
+    if len(args) < 32 * (path_offset + 1 + path_len):
+        raise ValueError("Truncated swap calldata")
+    return {
+        "amountIn": int.from_bytes(word(0), "big"),
+        "amountOutMin": int.from_bytes(word(1), "big"),
+        "path": ["0x" + word(path_offset + 1 + i)[12:].hex() for i in range(path_len)],
+        "to": "0x" + word(3)[12:].hex(),
+        "deadline": int.from_bytes(word(4), "big"),
+    }
 
 class SandwichStrategy:
     def __init__(self, dex: DexAdapter, min_profit_usd: Decimal):
@@ -49,10 +76,22 @@ class SandwichStrategy:
         
         return current_state
 
+    @staticmethod
+    def is_candidate(tx: dict) -> bool:
+        """Cheap synchronous pre-filter: only txs sent to the router can be victims."""
+        return str(tx.get('to')).lower() == _UNISWAP_V2_ROUTER_LOWER
+
     def decode_if_target(self, tx: dict) -> (bool, dict):
         """Decodes Uniswap V2 swap transactions."""
-        if str(tx.get('to')).lower() != UNISWAP_V2_ROUTER.lower():
+        if not self.is_candidate(tx):
             return False, {}
+        calldata = tx.get('input') or ""
+        if calldata[:10].lower() == _SWAP_EXACT_TOKENS_SELECTOR_HEX:
+            try:
+                return True, decode_swap_exact_tokens(calldata)
+            except ValueError:
+                return False, {}
+        # Fall back to the generic decoder for the router's other entrypoints
         try:
             func_obj, func_params = self.uniswap_contract.decode_function_input(tx['input'])
             if 'swap' in func_obj.fn_name:
@@ -0,0 +1,14 @@
+# Shared builders for tests that need synthetic block headers.
+from eth_utils import keccak
+
+def make_bloom(*items: bytes) -> bytes:
+    bloom = bytearray(256)
+    for item in items:
+        digest = keccak(item)
+        for i in (0, 2, 4):
+            bit = ((digest[i] << 8) | digest[i + 1]) & 2047
+            bloom[255 - bit // 8] |= 1 << (bit % 8)
+    return bytes(bloom)
+
+def head(number: int, *logged: bytes) -> dict:
+    return {"number": hex(number), "logsBloom": "0x" + make_bloom(*logged).hex()}
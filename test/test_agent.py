@@ -0,0 +1,125 @@
+import asyncio
+from decimal import Decimal
+
+import msgspec
+import orjson
+import pytest
+
+from src.core import agent as agent_module
+from src.core import mutation
+from src.core.state import State
+
+def test_strategy_config_is_a_read_only_whitelist():
+    config = agent_module.FROZEN_CONFIG
+    assert set(config) == set(agent_module.STRATEGY_CONFIG_FIELDS)
+    assert not any(name in config for name in ("EXECUTOR_PRIVATE_KEY", "BINANCE_API_SECRET", "REDIS_URL"))
+    assert isinstance(config["SANDWICH_MIN_PROFIT"], Decimal)
+    with pytest.raises(TypeError):
+        config["chain_id"] = 5
+
+class FakeRedis:
+    """Dict-backed stand-in for the async Redis client; counts writes."""
+    def __init__(self, data=None):
+        self.data = dict(data or {})
+        self.sets = 0
+    async def get(self, key):
+        return self.data.get(key)
+    async def set(self, key, value):
+        self.sets += 1
+        self.data[key] = value
+    async def aclose(self, close_connection_pool=None):
+        pass
+
+class FailingStrategy:
+    """Scribbles on the state's containers in place, then fails."""
+    strategy_name = "failing"
+    def __init__(self):
+        self.aborts = []
+    async def run(self, state, adapters, config):
+        state.history.append({"event_type": "PARTIAL"})
+        state.capital_base["ETH"] = Decimal("-1")
+        raise RuntimeError("boom")
+    async def abort(self, reason):
+        self.aborts.append(reason)
+
+def make_agent(strategy=None, state=None, adapters=None, redis=None) -> agent_module.Agent:
+    agent = agent_module.Agent(strategy or FailingStrategy(), state or State(), adapters or {})
+    agent.redis = redis or FakeRedis()
+    return agent
+
+@pytest.mark.asyncio
+async def test_unchanged_state_writes_are_skipped_until_refresh(monkeypatch):
+    monkeypatch.setattr(agent_module, "STATE_REWRITE_EVERY", 2)
+    agent = make_agent()
+    state = State()
+    await agent._save_state(state)
+    for counter in range(1, 4):  # only the cycle counter moves
+        await agent._save_state(state.copy(update={"cycle_counter": counter}))
+    # first write, two skips, then the forced refresh
+    assert agent.redis.sets == 2
+    stored = msgspec.msgpack.decode(agent.redis.data[agent_module.STATE_KEY.format(state.session_id)])
+    assert stored["cycle_counter"] == 3
+    await agent._save_state(state.record_trade({"id": "t1"}))
+    assert agent.redis.sets == 3
+
+@pytest.mark.asyncio
+async def test_restore_prefers_msgpack_and_falls_back_to_legacy_json():
+    state = State(capital_base={"ETH": Decimal("1.5")}, cycle_counter=7)
+    payload, _ = agent_module._serialize_state(state)
+    agent = make_agent(state=State(session_id=state.session_id), redis=FakeRedis({
+        agent_module.STATE_KEY.format(state.session_id): payload,
+        agent_module.LEGACY_STATE_KEY.format(state.session_id): orjson.dumps({"cycle_counter": 1}),
+    }))
+    await agent.initialize()
+    assert agent.state.cycle_counter == 7 and agent.state.capital_base == {"ETH": Decimal("1.5")}
+
+    legacy = state.model_dump_json()
+    agent = make_agent(state=State(session_id=state.session_id), redis=FakeRedis({
+        agent_module.LEGACY_STATE_KEY.format(state.session_id): legacy,
+    }))
+    await agent.initialize()
+    assert agent.state.cycle_counter == 7 and agent.state.capital_base == {"ETH": Decimal("1.5")}
+
+@pytest.mark.asyncio
+async def test_failed_cycle_rolls_back_in_place_edits(monkeypatch):
+    async def no_mutation(strategy, state, adapters):
+        return None
+    monkeypatch.setattr(mutation, "sandboxed_mutate", no_mutation)
+    strategy = FailingStrategy()
+    agent = make_agent(strategy, State(capital_base={"ETH": Decimal("2")}))
+    agent.run_interval = 0
+    await asyncio.wait_for(agent.run_loop(), 1)
+    assert agent.state.history == []
+    assert agent.state.capital_base == {"ETH": Decimal("2")}
+    assert strategy.aborts[0] == "Repeated failures"
+    assert agent.redis.sets == 0  # failed cycles are never persisted
+
+class BundleTxManager:
+    """Fails the sends whose id is in ``failing``; tracks peak concurrency."""
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.active = 0
+        self.peak = 0
+        self.sent = []
+    def build_bundle(self, state, trades):
+        return [{"id": t} for t in trades]
+    async def send(self, tx):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0)
+        self.active -= 1
+        if tx["id"] in self.failing:
+            raise RuntimeError(f"send {tx['id']} failed")
+        self.sent.append(tx["id"])
+        return tx["id"]
+
+@pytest.mark.asyncio
+async def test_bundle_sends_are_bounded_and_failures_surface():
+    tx_manager = BundleTxManager(failing={"t3", "t7"})
+    agent = make_agent(adapters={"tx_manager": tx_manager})
+    trades = [f"t{i}" for i in range(20)]
+    with pytest.raises(RuntimeError, match="send t3 failed"):
+        await agent._two_phase_commit(trades)
+    assert tx_manager.peak == agent_module.BUNDLE_SEND_CONCURRENCY
+    assert len(tx_manager.sent) == 18  # one failure does not cancel the other legs
+    assert agent.state.pending_transfers == set()
@@ -0,0 +1,27 @@
+# /test/test_ai_model.py
+# - Verifies operator-approved mutations are schema-checked before they are applied.
+
+import os
+import pytest
+
+from src.adapters import ai_model
+from src.adapters.ai_model import AIModelAdapter
+
+@pytest.fixture
+def adapter(tmp_path, monkeypatch):
+    monkeypatch.setattr(ai_model, "APPROVAL_DIR", str(tmp_path))
+    return AIModelAdapter()
+
+def test_approved_mutation_is_validated_and_consumed(adapter, tmp_path):
+    path = tmp_path / "arb.approved.json"
+    path.write_bytes(b'{"trade_amount": "2", "min_profit_usd": "10", "rationale": "x"}')
+    assert adapter.get_approved_mutation("arb") == {"trade_amount": "2", "min_profit_usd": "10"}
+    assert not path.exists()
+    assert adapter.get_approved_mutation("arb") is None
+
+def test_invalid_approved_mutation_is_quarantined(adapter, tmp_path):
+    path = tmp_path / "arb.approved.json"
+    path.write_bytes(b'{"trade_amount": 2}')
+    assert adapter.get_approved_mutation("arb") is None
+    assert not path.exists()
+    assert os.path.exists(str(path) + ".corrupted")
@@ -0,0 +1,30 @@
+import pytest
+from eth_utils import keccak
+
+from src.adapters.bridge import StargateBridgeAdapter, STARGATE_SWAP_SELECTOR, _verify_merkle_proof
+
+ROUTER = "0x8731d54E9D02c286767d56ac03e8037C07e01e98"
+RECIPIENT = "0x000000000000000000000000000000000000dEaD"
+
+class DummyTxManager:
+    w3 = None
+    def __init__(self):
+        self.sent = []
+    async def build_and_send_transaction(self, tx_params):
+        self.sent.append(tx_params)
+        return "0xhash"
+
+def test_merkle_proof_sorted_pairs():
+    a, b, c = keccak(b"a"), keccak(b"b"), keccak(b"c")
+    ab = keccak(min(a, b) + max(a, b))
+    root = keccak(min(ab, c) + max(ab, c))
+    assert _verify_merkle_proof([b.hex(), "0x" + c.hex()], a.hex(), root.hex())
+    assert not _verify_merkle_proof([c.hex()], a.hex(), root.hex())
+
+@pytest.mark.asyncio
+async def test_bridge_asset_awaits_broadcast():
+    tx_manager = DummyTxManager()
+    bridge = StargateBridgeAdapter(tx_manager, ROUTER)
+    tx_hash = await bridge.bridge_asset(110, 1, 1, 10**6, 99 * 10**4, RECIPIENT, RECIPIENT, 0)
+    assert tx_hash == "0xhash"
+    assert tx_manager.sent[0]["data"].startswith(STARGATE_SWAP_SELECTOR)
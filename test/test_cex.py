@@ -0,0 +1,50 @@
+import asyncio
+import pytest
+
+from src.adapters.cex import CexAdapter, CexError
+
+class DummyCex(CexAdapter):
+    """Serves a canned withdraw history and counts round trips."""
+    def __init__(self, records):
+        super().__init__()
+        self.records = records
+        self.calls = 0
+    async def _send_signed_request(self, method, endpoint, params=None):
+        self.calls += 1
+        await asyncio.sleep(0)
+        return self.records
+
+@pytest.mark.asyncio
+async def test_concurrent_transfer_polls_share_one_request():
+    cex = DummyCex([{"id": "a", "status": 6}, {"id": "b", "status": 5}])
+    results = await asyncio.gather(
+        cex.get_transfer_status("a", "withdraw"),
+        cex.get_transfer_status("b", "withdraw"),
+    )
+    assert results == ["SUCCESS", "FAILED"]
+    assert cex.calls == 1
+
+@pytest.mark.asyncio
+async def test_transfer_poll_times_out_as_pending():
+    cex = DummyCex([])
+    assert await cex.get_transfer_status("a", "withdraw", max_wait_s=0) == "PENDING"
+
+class HtmlErrorSession:
+    """Answers every request like a gateway outage: 502 with an HTML body."""
+    closed = False
+    status = 502
+    def request(self, method, path):
+        return self
+    async def __aenter__(self):
+        return self
+    async def __aexit__(self, *exc):
+        return False
+    async def read(self):
+        return b"<html><body>Bad Gateway</body></html>"
+
+@pytest.mark.asyncio
+async def test_non_json_error_body_raises_cex_error():
+    cex = CexAdapter()
+    cex._session = HtmlErrorSession()
+    with pytest.raises(CexError, match="502"):
+        await cex._request("GET", "/api/v3/ping")
@@ -0,0 +1,120 @@
+from collections import OrderedDict
+from types import SimpleNamespace
+
+import pytest
+from eth_abi import encode as abi_encode, decode as abi_decode
+
+from src.adapters import dex as dex_module
+from src.adapters.dex import DexAdapter
+from src.abis.uniswap_v2 import SWAP_EXACT_TOKENS_FOR_TOKENS_SELECTOR
+from src.abis.multicall3 import MULTICALL3_ADDRESS, AGGREGATE3_CALLS_TYPE, AGGREGATE3_RESULTS_TYPE
+
+WETH_ADDR = "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2"
+USDC_ADDR = "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48"
+RECIPIENT = "0x000000000000000000000000000000000000dEaD"
+ROUTER = "0x7a250d5630B4cF539739dF2C5dAcb4c659F2488D"
+
+class SyncEth:
+    """Sync web3 stand-in: block_number is a property, reads return plain values."""
+    def __init__(self, block_number=100, base_fee=7):
+        self.block_number = block_number
+        self.base_fee = base_fee
+        self.get_block_calls = 0
+    def get_block(self, number):
+        self.get_block_calls += 1
+        return {"number": number, "baseFeePerGas": self.base_fee}
+
+class MulticallEth:
+    """Answers aggregate3 by handing each (target, calldata) to ``answer``."""
+    def __init__(self, answer):
+        self.answer = answer
+        self.calls = 0
+    def call(self, tx):
+        assert tx["to"] == MULTICALL3_ADDRESS
+        self.calls += 1
+        calls = abi_decode([AGGREGATE3_CALLS_TYPE], tx["data"][4:])[0]
+        return abi_encode([AGGREGATE3_RESULTS_TYPE], [[self.answer(target, data) for target, _, data in calls]])
+
+def make_dex(eth) -> DexAdapter:
+    dex = DexAdapter.__new__(DexAdapter)  # no provider or tx manager needed
+    dex.w3 = SimpleNamespace(eth=eth)
+    dex.router_address = ROUTER
+    dex.tx_manager = SimpleNamespace(address=RECIPIENT)
+    dex._block_cache = None
+    dex._allowance_data = None
+    dex._swap_tpl_cache = OrderedDict()
+    return dex
+
+def test_swap_template_matches_full_encoding():
+    dex = DexAdapter.__new__(DexAdapter)  # encoding needs no provider
+    dex._swap_tpl_cache = OrderedDict()
+    path = [WETH_ADDR, USDC_ADDR]
+    for amount_in, min_out, deadline in [(10**18, 1234, 1_700_000_000), (5, 0, 2**40)]:
+        expected = SWAP_EXACT_TOKENS_FOR_TOKENS_SELECTOR + abi_encode(
+            ["uint256", "uint256", "address[]", "address", "uint256"], [amount_in, min_out, path, RECIPIENT, deadline]
+        )
+        assert dex._encode_swap(amount_in, min_out, path, RECIPIENT, deadline) == expected
+    assert len(dex._swap_tpl_cache) == 1
+
+def test_swap_template_cache_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(dex_module, "SWAP_TPL_CACHE_SIZE", 2)
+    dex = DexAdapter.__new__(DexAdapter)
+    dex._swap_tpl_cache = OrderedDict()
+    a, b, c = [WETH_ADDR, USDC_ADDR], [USDC_ADDR, WETH_ADDR], [WETH_ADDR, RECIPIENT]
+    dex._encode_swap(1, 0, a, RECIPIENT, 0)
+    dex._encode_swap(1, 0, b, RECIPIENT, 0)
+    dex._encode_swap(1, 0, a, RECIPIENT, 0)  # refreshes a
+    dex._encode_swap(1, 0, c, RECIPIENT, 0)  # evicts b
+    assert list(dex._swap_tpl_cache) == [(tuple(a), RECIPIENT), (tuple(c), RECIPIENT)]
+
+@pytest.mark.asyncio
+async def test_base_fee_fetches_block_once_per_number():
+    eth = SyncEth(block_number=100, base_fee=7)
+    dex = make_dex(eth)
+    assert await dex._base_fee() == 7
+    eth.base_fee = 9
+    assert await dex._base_fee() == 7  # same block: served from cache
+    assert eth.get_block_calls == 1
+    eth.block_number = 101
+    assert await dex._base_fee() == 9
+    assert eth.get_block_calls == 2
+
+@pytest.mark.asyncio
+async def test_quotes_batch_keeps_order_and_marks_failures():
+    def answer(target, data):
+        amount_in, path = abi_decode(["uint256", "address[]"], data[4:])
+        if amount_in == 2:
+            return (False, b"")  # no pool: the call reverts
+        if amount_in == 3:
+            return (True, b"")  # router without code: empty success
+        return (True, abi_encode(["uint256[]"], [[amount_in, amount_in * 10]]))
+    eth = MulticallEth(answer)
+    dex = make_dex(eth)
+    path = [WETH_ADDR, USDC_ADDR]
+    quotes = await dex.get_quotes_batch([(4, path), (2, path), (1, path), (3, path)])
+    assert quotes == [[4, 40], None, [1, 10], None]
+    assert eth.calls == 1
+
+@pytest.mark.asyncio
+async def test_allowances_batch_keys_by_checksum_and_defaults_to_zero():
+    def answer(target, data):
+        if target.lower() == USDC_ADDR.lower():
+            return (False, b"")
+        return (True, abi_encode(["uint256"], [123]))
+    dex = make_dex(MulticallEth(answer))
+    allowances = await dex.allowances_batch([WETH_ADDR.lower(), USDC_ADDR.lower()])
+    assert allowances == {WETH_ADDR: 123, USDC_ADDR: 0}
+
+class CallEth:
+    """Sync eth.call returning fixed bytes."""
+    def __init__(self, ret):
+        self.ret = ret
+    def call(self, tx):
+        return self.ret
+
+@pytest.mark.asyncio
+async def test_quote_and_allowance_reads_use_sync_call():
+    dex = make_dex(CallEth(abi_encode(["uint256[]"], [[5, 50]])))
+    assert await dex.get_quote(5, [WETH_ADDR, USDC_ADDR]) == [5, 50]
+    dex = make_dex(CallEth(abi_encode(["uint256"], [10**18])))
+    assert await dex.approve(WETH_ADDR, 10**6) is None  # enough allowance: no tx
@@ -10,7 +10,8 @@ import logging
 
 from src.core.config import settings
 from src.core.tx import TransactionManager
-from src.adapters.dex import DexAdapter, ERC20_ABI
+from src.adapters.dex import DexAdapter
+from src.abis.erc20 import ERC20_ABI
 
 # --- Real Mainnet Addresses ---
 WETH_ADDR = "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2"
@@ -0,0 +1,47 @@
+import asyncio
+import pytest
+
+from src.core import heads
+from src.core.heads import HeadWatcher, bloom_contains
+from test.helpers import head, make_bloom
+
+POOL = bytes.fromhex("87870Bca3F3fD6335C3F4ce8392D69350B4fA4E2")
+OTHER = bytes.fromhex("A0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48")
+
+def test_bloom_membership():
+    bloom = make_bloom(POOL)
+    assert bloom_contains(bloom, POOL)
+    assert not bloom_contains(bloom, OTHER)
+    assert not bloom_contains(bytes(256), POOL)
+
+@pytest.mark.asyncio
+async def test_waiters_wake_on_relevant_heads_only():
+    watcher = HeadWatcher(url="")
+    any_head = asyncio.create_task(watcher.wait(1.0))
+    pool_head = asyncio.create_task(watcher.wait(1.0, (POOL,)))
+    await asyncio.sleep(0)
+    watcher.on_head(head(1, OTHER))
+    assert await any_head is True
+    await asyncio.sleep(0)
+    assert not pool_head.done()
+    watcher.on_head(head(2, POOL))
+    assert await pool_head is True
+    assert await watcher.wait(0.01) is False
+
+
+@pytest.mark.asyncio
+async def test_run_keeps_reconnecting_after_unexpected_errors(monkeypatch):
+    attempts = []
+    def failing_connect(url, **kwargs):
+        attempts.append(url)
+        raise ValueError("server rejected WebSocket connection: HTTP 503")
+    monkeypatch.setattr(heads, "ws_connect", failing_connect)
+    monkeypatch.setattr(heads, "RECONNECT_DELAY_S", 0.001)
+    monkeypatch.setattr(heads, "MAX_RECONNECT_DELAY_S", 0.002)
+    task = asyncio.create_task(HeadWatcher(url="wss://node").run())
+    await asyncio.sleep(0.05)
+    assert not task.done()
+    assert len(attempts) > 1
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
@@ -1,7 +1,9 @@
 import os
+import asyncio
 import pytest
 from fastapi.testclient import TestClient
 
+from src.core import kill
 from src.core.kill import activate_kill_switch, deactivate_kill_switch, check, KillSwitchActiveError, KILL_SWITCH_FILE
 from src.core.control_api import app
 from src.core.config import settings
@@ -18,6 +20,39 @@ def test_kill_check_raises():
         check()
 
 
+@pytest.mark.asyncio
+async def test_refresher_serves_cached_flag():
+    refresher = asyncio.create_task(kill.run_kill_refresher(interval=0.01))
+    await asyncio.sleep(0.02)
+    assert kill._cached_active is False
+    check()
+    activate_kill_switch("test")  # applied to the cache without waiting for a refresh
+    with pytest.raises(KillSwitchActiveError):
+        check()
+    refresher.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await refresher
+    assert kill._cached_active is None
+
+
+@pytest.mark.asyncio
+async def test_refresher_survives_backend_errors(monkeypatch):
+    reads = iter([RuntimeError("backend down"), False])
+    def flaky():
+        result = next(reads, False)
+        if isinstance(result, Exception):
+            raise result
+        return result
+    monkeypatch.setattr(kill, "is_kill_switch_active", flaky)
+    refresher = asyncio.create_task(kill.run_kill_refresher(interval=0.01))
+    await asyncio.sleep(0.03)
+    assert not refresher.done()
+    assert kill._cached_active is False
+    refresher.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await refresher
+
+
 def test_control_api_toggle(monkeypatch):
     monkeypatch.setattr(settings, "CONTROL_API_TOKEN", "tok")
     client = TestClient(app)
@@ -0,0 +1,40 @@
+import pytest
+
+from src.core.address import to_checksum
+from src.core.heads import HeadWatcher
+from src.strategies.liquidation import AaveUserIndex
+from src.abis.aave_v3 import BORROW_TOPIC
+from test.helpers import head
+
+WETH = "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2"
+USDC = "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48"
+WETH_FEED = "0x5f4eC3Df9cbd43714FE2740f5E3616155c5b8419"
+USDC_FEED = "0x8fFfFfd4AfB6115b954Bd326cbe7B4BA576818f6"
+ALICE = to_checksum("0x00000000000000000000000000000000000a11ce")
+BOB = to_checksum("0x0000000000000000000000000000000000000b0b")
+
+def borrow_log(reserve: str, user: str) -> dict:
+    pad = lambda a: "0x" + a[2:].lower().rjust(64, "0")
+    return {"topics": ["0x" + BORROW_TOPIC.hex(), pad(reserve), pad(user)]}
+
+class DummyOracle:
+    def __init__(self):
+        self.queried = []
+    async def get_user_health_factors_raw(self, users):
+        self.queried.append(list(users))
+        return {user: 10**17 for user in users}
+
+@pytest.mark.asyncio
+async def test_only_users_exposed_to_moved_feeds_are_scanned():
+    index = AaveUserIndex({WETH_FEED: WETH, USDC_FEED: USDC})
+    index.apply_log(borrow_log(WETH, ALICE))
+    index.apply_log(borrow_log(USDC, BOB))
+    heads = HeadWatcher(url="")
+    heads.on_head(head(1, bytes.fromhex(WETH_FEED[2:])))
+    oracle = DummyOracle()
+    assert await index.liquidatable(oracle, heads) == [ALICE]
+    assert oracle.queried == [[ALICE]]
+
+    heads.on_head(head(2))
+    assert await index.liquidatable(oracle, heads) == []
+    assert len(oracle.queried) == 1
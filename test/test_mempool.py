@@ -0,0 +1,69 @@
+import asyncio
+import pytest
+
+from src.adapters.mempool import MempoolAdapter, _is_tx_frame, _hash_only_result
+
+class ScriptedMempool(MempoolAdapter):
+    """Replays a fixed tx sequence with a pause between bursts."""
+    async def stream_transactions(self):
+        for i in range(5):
+            yield {"hash": i}
+        await asyncio.sleep(0.05)
+        for i in range(5, 7):
+            yield {"hash": i}
+
+@pytest.mark.asyncio
+async def test_stream_batches_fills_and_lingers():
+    adapter = ScriptedMempool(wss_urls=["wss://dummy"])
+    batches = [[tx["hash"] for tx in b] async for b in adapter.stream_batches(max_batch=3)]
+    assert batches == [[0, 1, 2], [3, 4], [5, 6]]
+
+def test_tx_frame_precheck():
+    assert _is_tx_frame(b'{"params":{"result":{"hash":"0x1"}}}')
+    assert _is_tx_frame('{"params": {"result": {"hash": "0x1"}}}')
+    assert not _is_tx_frame(b'{"id":1,"jsonrpc":"2.0"}')
+    assert not _is_tx_frame('{"params":{"result":"0xabc"}}')
+
+class FramedMempool(MempoolAdapter):
+    """Each feed's reader replays its own raw frames."""
+    def __init__(self, frames_by_url, queue_size=4096):
+        super().__init__(wss_urls=list(frames_by_url), queue_size=queue_size)
+        self.frames_by_url = frames_by_url
+    async def _reader(self, url):
+        for frame in self.frames_by_url[url]:
+            self._enqueue(frame)
+
+@pytest.mark.asyncio
+async def test_reader_queue_drops_oldest_and_parses():
+    frames = [b'{"id":1,"result":"0xsub"}'] + [
+        b'{"params":{"result":{"hash":"%d"}}}' % i for i in range(4)
+    ]
+    adapter = FramedMempool({"wss://a": frames}, queue_size=3)
+    assert [tx["hash"] async for tx in adapter.stream_transactions()] == ["2", "3"]
+
+@pytest.mark.asyncio
+async def test_feeds_are_merged_and_deduplicated():
+    frame = b'{"params":{"result":{"hash":"%s"}}}'
+    adapter = FramedMempool({
+        "wss://a": [frame % b"x", frame % b"y"],
+        "wss://b": [frame % b"x", frame % b"z"],
+    })
+    assert sorted([tx["hash"] async for tx in adapter.stream_transactions()]) == ["x", "y", "z"]
+
+TX_HASH = "0x" + "ab" * 32
+
+def test_hash_only_result_is_sliced_without_parsing():
+    frame = '{"jsonrpc":"2.0","method":"eth_subscription","params":{"subscription":"0x1","result":"%s"}}' % TX_HASH
+    assert _hash_only_result(frame) == TX_HASH
+    assert _hash_only_result(frame.encode()) == TX_HASH
+    assert _hash_only_result(b'{"id":1,"result":"0x' + b"cd" * 16 + b'"}') is None  # subscription ack
+    assert _hash_only_result(b'{"params":{"result":{"hash":"0x1"}}}') is None
+
+@pytest.mark.asyncio
+async def test_hash_only_feeds_yield_hashes_when_enabled():
+    frame = b'{"params":{"result":"%s"}}' % TX_HASH.encode()
+    adapter = FramedMempool({"wss://a": [frame, frame]})
+    assert [tx async for tx in adapter.stream_transactions()] == []
+    adapter = FramedMempool({"wss://a": [frame, frame]})
+    adapter.yield_hashes = True
+    assert [tx async for tx in adapter.stream_transactions()] == [{"hash": TX_HASH}]
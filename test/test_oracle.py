@@ -0,0 +1,120 @@
+import asyncio
+import time
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+from eth_abi import encode as abi_encode, decode as abi_decode
+
+from src.adapters import oracle as oracle_module
+from src.adapters.oracle import OracleAdapter
+from src.abis.multicall3 import AGGREGATE3_CALLS_TYPE, AGGREGATE3_RESULTS_TYPE
+
+POOL = "0x87870Bca3F3fD6335C3F4ce8392D69350B4fA4E2"
+
+class DummyEth:
+    """Health factor = 10**18 * (last byte of the user address), direct or via aggregate3."""
+    def __init__(self):
+        self.calls = 0
+    def call(self, tx):
+        self.calls += 1
+        if tx["to"] == POOL:
+            return abi_encode(["uint256"] * 6, [0, 0, 0, 0, 0, tx["data"][-1] * 10**18])
+        calls = abi_decode([AGGREGATE3_CALLS_TYPE], tx["data"][4:])[0]
+        results = []
+        for _, _, calldata in calls:
+            hf = calldata[-1] * 10**18
+            results.append((True, abi_encode(["uint256"] * 6, [0, 0, 0, 0, 0, hf])))
+        return abi_encode([AGGREGATE3_RESULTS_TYPE], [results])
+
+def make_oracle():
+    oracle = OracleAdapter.__new__(OracleAdapter)  # no RPC providers needed
+    oracle.w3 = SimpleNamespace(eth=DummyEth())
+    oracle.pool_address = POOL
+    return oracle
+
+@pytest.mark.asyncio
+async def test_health_factors_are_batched(monkeypatch):
+    monkeypatch.setattr(oracle_module, "HEALTH_FACTOR_BATCH_SIZE", 2)
+    oracle = make_oracle()
+    users = [f"0x{i:040x}" for i in range(1, 6)]
+    factors = await oracle.get_user_health_factors(users)
+    assert factors == {u: Decimal(i) for i, u in enumerate(users, start=1)}
+    assert oracle.w3.eth.calls == 3
+    assert await oracle.get_user_health_factor_raw(users[0]) == 10**18
+
+class DummyProvider:
+    def get_primary_provider(self):
+        return None
+
+class CountingOracle(OracleAdapter):
+    """Price sources answer locally and count how often the fan-out runs."""
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.fetches = 0
+    async def _coingecko_price(self, pair):
+        self.fetches += 1
+        await asyncio.sleep(0)
+        return Decimal("100")
+    async def _chainlink_price(self, pair):
+        return Decimal("100.5")
+    async def _uniswap_twap(self, pair):
+        return Decimal("100.5")
+
+@pytest.mark.asyncio
+async def test_price_is_single_flight_and_cached(monkeypatch):
+    monkeypatch.setattr(oracle_module, "ResilientWeb3Provider", DummyProvider)
+    oracle = CountingOracle()
+    prices = await asyncio.gather(*(oracle.get_price("ETH/USD") for _ in range(5)))
+    assert prices == [Decimal("100.5")] * 5
+    assert await oracle.get_price("ETH/USD") == Decimal("100.5")
+    assert oracle.fetches == 1
+
+class SlowCoinGeckoOracle(CountingOracle):
+    async def _coingecko_price(self, pair):
+        await asyncio.sleep(10)
+
+@pytest.mark.asyncio
+async def test_slow_coingecko_does_not_stall_price(monkeypatch):
+    monkeypatch.setattr(oracle_module, "ResilientWeb3Provider", DummyProvider)
+    oracle = SlowCoinGeckoOracle()
+    price = await asyncio.wait_for(oracle.get_price("ETH/USD"), 0.5)
+    assert price == Decimal("100.5")
+
+class RoundProvider(DummyProvider):
+    """Answers the on-chain batch: latestRoundData, then a TWAP of 2000."""
+    def __init__(self, round_data):
+        self.round_data = round_data
+        self.batches = 0
+    async def batch_call_consensus(self, client, calls, block="latest"):
+        self.batches += 1
+        await asyncio.sleep(0)
+        return [
+            abi_encode(["uint80", "int256", "uint256", "uint256", "uint80"], list(self.round_data)),
+            abi_encode(["uint256"], [2000 * 10**18]),
+        ]
+
+@pytest.mark.asyncio
+async def test_stale_chainlink_round_is_rejected(monkeypatch):
+    monkeypatch.setattr(oracle_module, "ResilientWeb3Provider", DummyProvider)
+    oracle = OracleAdapter(heartbeat=60)
+    now = int(time.time())
+    oracle.provider = RoundProvider((5, 2000 * 10**8, now, now - 10, 5))
+    assert await oracle._chainlink_price("ETH/USD") == Decimal(2000)
+    oracle.provider = RoundProvider((5, 2000 * 10**8, now, now - 120, 5))
+    with pytest.raises(ValueError):
+        await oracle._chainlink_price("ETH/USD")
+    oracle.provider = RoundProvider((6, 2000 * 10**8, now, now, 5))
+    with pytest.raises(ValueError):
+        await oracle._chainlink_price("ETH/USD")
+
+@pytest.mark.asyncio
+async def test_onchain_legs_share_one_batch(monkeypatch):
+    monkeypatch.setattr(oracle_module, "ResilientWeb3Provider", DummyProvider)
+    oracle = OracleAdapter()
+    now = int(time.time())
+    oracle.provider = RoundProvider((5, 2000 * 10**8, now, now, 5))
+    chainlink, twap = await asyncio.gather(oracle._chainlink_price("ETH/USD"), oracle._uniswap_twap("ETH/USD"))
+    assert chainlink == twap == Decimal(2000)
+    assert oracle.provider.batches == 1
+    assert oracle._onchain_inflight == {}
@@ -1,5 +1,6 @@
 import asyncio
 import os
+import struct
 import pytest
 
 from src.core.tx import TransactionManager
@@ -7,15 +8,18 @@ from src.core.nonce_manager import NonceManager
 from src.core.config import settings
 
 class DummyEth:
-    async def estimate_gas(self, _):
+    # Sync like web3.Web3: plain methods, with the fee reads as properties
+    def estimate_gas(self, _):
         return 21000
-    async def send_raw_transaction(self, _):
+    def send_raw_transaction(self, _):
         return b'hash'
-    async def gas_price(self):
+    @property
+    def gas_price(self):
         return 1
-    async def max_priority_fee(self):
+    @property
+    def max_priority_fee(self):
         return 1
-    async def get_transaction_count(self, _):
+    def get_transaction_count(self, *_):
         return 0
     class account:
         @staticmethod
@@ -37,7 +41,7 @@ class DummyLock:
 class DummyRedis:
     def lock(self, name, timeout=10):
         return DummyLock()
-    async def close(self):
+    async def aclose(self, close_connection_pool=None):
         pass
 
 @pytest.mark.asyncio
@@ -56,3 +60,33 @@ async def test_nonce_collision_handled(tmp_path, monkeypatch):
 
     await asyncio.gather(send(), send())
     assert await tm.nonce_manager.get() == 2
+    await tm.nonce_manager.flush()
+    with open(os.path.join(str(tmp_path), "nonce.state"), "rb") as f:
+        assert struct.unpack("<Q", f.read())[0] == 2
+
+
+@pytest.mark.asyncio
+async def test_pending_nonce_flush_precedes_broadcast(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, 'SESSION_DIR', str(tmp_path))
+    events = []
+    class RecordingEth(DummyEth):
+        def send_raw_transaction(self, raw):
+            events.append("send")
+            return super().send_raw_transaction(raw)
+    tm = TransactionManager()
+    tm.w3 = DummyW3()
+    tm.w3.eth = RecordingEth()
+    tm.account = type('A', (), {'key': '0x0'})()
+    tm.address = '0xabc'
+    tm.nonce_manager = NonceManager(tm.w3, tm.address)
+    tm.redis = DummyRedis()
+    await tm.nonce_manager.initialize()
+    flush = tm.nonce_manager.flush
+    async def recording_flush():
+        await flush()
+        events.append("flushed")
+    monkeypatch.setattr(tm.nonce_manager, "flush", recording_flush)
+
+    await tm.build_and_send_transaction({'to': '0x1'})
+    await tm.build_and_send_transaction({'to': '0x1'})
+    assert events == ["flushed", "send", "flushed", "send"]
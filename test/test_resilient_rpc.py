@@ -0,0 +1,31 @@
+from types import SimpleNamespace
+
+import orjson
+import pytest
+
+from src.core.resilient_rpc import ResilientWeb3Provider
+
+class BatchProvider(ResilientWeb3Provider):
+    """Answers batches locally: each node returns data = its fixed answer per call id."""
+    def __init__(self, answers_by_url):
+        self.providers = [SimpleNamespace(provider=SimpleNamespace(endpoint_uri=url)) for url in answers_by_url]
+        self.answers_by_url = answers_by_url
+        self.posts = []
+    async def _post_batch(self, client, url, body):
+        self.posts.append(url)
+        answers = self.answers_by_url[url]
+        if answers is None:
+            raise OSError("node down")
+        return [{"jsonrpc": "2.0", "id": r["id"], "result": answers[r["id"]]} for r in orjson.loads(body)]
+
+@pytest.mark.asyncio
+async def test_batch_consensus_takes_majority_per_call():
+    provider = BatchProvider({
+        "http://a": ["0x01", "0x02"],
+        "http://b": ["0x01", "0x03"],
+        "http://c": ["0x01", "0x02"],
+        "http://d": None,
+    })
+    results = await provider.batch_call_consensus(None, [("0x1", b"\x01"), ("0x2", b"\x02")])
+    assert results == [b"\x01", b"\x02"]
+    assert len(provider.posts) == 4
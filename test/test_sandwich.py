@@ -0,0 +1,23 @@
+from eth_abi import encode
+
+from src.abis.uniswap_v2 import SWAP_EXACT_TOKENS_FOR_TOKENS_SELECTOR
+from src.strategies.sandwich import decode_swap_exact_tokens
+
+WETH_ADDR = "0xc02aaa39b223fe8d0a0e5c4f27ead9083c756cc2"
+USDC_ADDR = "0xa0b86991c6218b36c1d19d4a2e9eb0ce3606eb48"
+RECIPIENT = "0x000000000000000000000000000000000000beef"
+
+def test_decode_swap_exact_tokens_matches_abi_encoding():
+    args = encode(
+        ["uint256", "uint256", "address[]", "address", "uint256"],
+        [10**18, 2500 * 10**6, [WETH_ADDR, USDC_ADDR], RECIPIENT, 1700000000],
+    )
+    calldata = "0x" + (SWAP_EXACT_TOKENS_FOR_TOKENS_SELECTOR + args).hex()
+    decoded = decode_swap_exact_tokens(calldata)
+    assert decoded == {
+        "amountIn": 10**18,
+        "amountOutMin": 2500 * 10**6,
+        "path": [WETH_ADDR, USDC_ADDR],
+        "to": RECIPIENT,
+        "deadline": 1700000000,
+    }
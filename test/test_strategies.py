@@ -11,7 +11,7 @@ from decimal import Decimal
 from src.core.state import State
 from src.core.kill import activate_kill_switch, KILL_SWITCH_FILE
 from src.strategies.cross_domain import CrossDomainArbitrageStrategy
-from src.adapters.mock import MockTransactionManager, MockDexAdapter
+from src.adapters.mock import MockTransactionManager, MockDexAdapter, MockAIModelAdapter
 
 # --- Constants for testing ---
 WETH_ADDR = "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2"
@@ -132,3 +132,21 @@ def test_strategy_is_halted_by_kill_switch(mock_env, kill_switch_context):
     assert len(adapters["tx_manager"].sent_transactions) == 0
     # State should be unchanged
     assert new_state is initial_state
+
+@pytest.mark.asyncio
+async def test_strategy_applies_queued_mutation(mock_env):
+    """
+    GIVEN queued AI suggestions for the strategy
+    WHEN the strategy mutates
+    THEN it should apply them one at a time, oldest first.
+    """
+    strategy, _, _ = mock_env
+    ai_model = MockAIModelAdapter()
+    ai_model.queue_suggestion(strategy.strategy_name, {"trade_amount": "2", "min_profit_usd": "0.1"})
+    ai_model.queue_suggestion(strategy.strategy_name, {"trade_amount": "3", "min_profit_usd": "0.2"})
+
+    assert await strategy.mutate({"ai_model": ai_model}) is True
+    assert strategy.trade_amount == Decimal("2")
+    assert await strategy.mutate({"ai_model": ai_model}) is True
+    assert strategy.trade_amount == Decimal("3")
+    assert await strategy.mutate({"ai_model": ai_model}) is False